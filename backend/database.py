@@ -1,7 +1,7 @@
 import os
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import select, text
+from sqlalchemy import inspect, select, text
 from backend.models import Base, User, FileStorage, utcnow
 from backend.auth.service import get_password_hash
 from backend.core.config import (
@@ -48,48 +48,54 @@ def _resolve_existing_path(path_value: Optional[str]) -> Optional[Path]:
     return None
 
 
-engine = create_async_engine(
-    DATABASE_URL, echo=False, future=True
-)
+def make_engine(url: str) -> AsyncEngine:
+    """Create an async engine for ``url`` without touching module-level state."""
+    return create_async_engine(url, echo=False, future=True)
 
-AsyncSessionLocal = sessionmaker(
-    bind=engine, class_=AsyncSession, expire_on_commit=False, autoflush=False, autocommit=False
-)
+
+def make_sessionmaker(bind: AsyncEngine) -> sessionmaker:
+    """Build the application's session factory bound to ``bind``."""
+    return sessionmaker(
+        bind=bind, class_=AsyncSession, expire_on_commit=False, autoflush=False, autocommit=False
+    )
 
 
-async def ensure_schema() -> None:
+engine = make_engine(DATABASE_URL)
+
+AsyncSessionLocal = make_sessionmaker(engine)
+
+
+async def ensure_schema(bind: Optional[AsyncEngine] = None) -> None:
     """Compare SQLAlchemy model definitions with the actual PostgreSQL schema.
 
     On every startup:
       1. Creates any tables that do not yet exist (IF NOT EXISTS semantics via
          SQLAlchemy create_all).
       2. For each table that already exists, adds any columns that are present in
-         the model but absent from the database.  Uses PostgreSQL
-         information_schema so no SQLite-specific PRAGMA calls remain.
+         the model but absent from the database.  Existing columns are read
+         through the SQLAlchemy inspector, so the check works on PostgreSQL
+         (the application database) and SQLite (the migration tests) alike.
 
-    The function is idempotent and safe to run repeatedly.
+    The function is idempotent and safe to run repeatedly.  ``bind`` defaults to
+    the application engine; the models' metadata is engine-independent, so any
+    engine can be migrated without re-importing ``backend.models``.
     """
+    bind = bind or engine
+
     # --- Step 1: create missing tables ---
-    async with engine.begin() as conn:
+    async with bind.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     logger.info("Schema check: all tables ensured")
 
     # --- Step 2: add missing columns to existing tables ---
-    dialect = engine.dialect
-    async with engine.begin() as conn:
+    dialect = bind.dialect
+    async with bind.begin() as conn:
         for table in Base.metadata.sorted_tables:
-            result = await conn.execute(
-                text(
-                    """
-                    SELECT column_name
-                    FROM information_schema.columns
-                    WHERE table_schema = current_schema()
-                      AND table_name   = :tname
-                    """
-                ),
-                {"tname": table.name},
+            existing_cols = await conn.run_sync(
+                lambda sync_conn, name=table.name: {
+                    col["name"] for col in inspect(sync_conn).get_columns(name)
+                }
             )
-            existing_cols = {row[0] for row in result}
 
             for col in table.columns:
                 if col.name in existing_cols:
@@ -101,10 +107,12 @@ async def ensure_schema() -> None:
                 except Exception:
                     col_type_str = str(col.type)
 
-                # PostgreSQL supports ADD COLUMN IF NOT EXISTS (≥ 9.6)
+                # PostgreSQL supports ADD COLUMN IF NOT EXISTS (≥ 9.6); SQLite
+                # does not, and the inspector check above already guards it
+                if_not_exists = "IF NOT EXISTS " if dialect.name == "postgresql" else ""
                 alter_sql = (
                     f'ALTER TABLE "{table.name}" '
-                    f'ADD COLUMN IF NOT EXISTS "{col.name}" {col_type_str}'
+                    f'ADD COLUMN {if_not_exists}"{col.name}" {col_type_str}'
                 )
                 logger.info(
                     "Schema migration: adding %s.%s (%s)",
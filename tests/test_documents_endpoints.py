@@ -2,305 +2,415 @@
 """
 Test documents endpoints
 """
+import argparse
 import asyncio
+import contextlib
 import aiohttp
 import json
+import orjson
+import pytest
 import base64
+from collections import defaultdict
 from typing import Dict, Any
 
+try:
+    import aiodns  # backs aiohttp.AsyncResolver
+except ImportError:
+    aiodns = None
+
+# POST /documents only accepts base64 inside JSON, so the fixed test
+# document is encoded once at import rather than on every upload
+TEST_DOCUMENT_BYTES = b"This is a test document for API testing."
+TEST_DOCUMENT_BASE64 = base64.b64encode(TEST_DOCUMENT_BYTES).decode("ascii")
+
+# Every request has a bounded wait so a dead server fails fast instead of hanging
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=5.0, connect=1.0)
+PREFLIGHT_TIMEOUT = aiohttp.ClientTimeout(total=1.0)
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _orjson_dumps(obj: Any) -> str:
+    """aiohttp json_serialize hook; aiohttp expects a str, orjson returns bytes"""
+    return orjson.dumps(obj).decode()
+
+
 class TestDocumentsEndpoints:
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    OPTIONS_ENDPOINTS: tuple[str, ...] = (
+        "/documents",
+        "/documents/1",  # Test with a document ID
+        "/documents/1/download",
+    )
+
+    # Request bodies never change, so they are serialized once and the same
+    # bytes are reused by every request (and any retry of it)
+    _USER_LOGIN_BODY = orjson.dumps({"username": "testuser", "password": "testpassword123"})
+    _ADMIN_LOGIN_BODY = orjson.dumps({"username": "admin", "password": "admin123"})
+    _DOCUMENT_BODY = orjson.dumps({
+        "file_name": "test_document.txt",
+        "file_data": TEST_DOCUMENT_BASE64,
+        "category": "test",
+        "description": "Test document for API testing"
+    })
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        verbose: bool = False,
+        run_admin: bool = True
+    ):
         self.base_url = base_url
+        self.verbose = verbose  # print a line per request, not just the summary
+        self.run_admin = run_admin  # False skips admin login and admin tests
+        # (passed, failed) per request kind
+        self.results: dict[str, tuple[int, int]] = defaultdict(lambda: (0, 0))
         self.test_document_id = None
         self.auth_token = None
         self.admin_token = None
+        self.session: aiohttp.ClientSession | None = None  # opened by open_session
+        self._connector: aiohttp.TCPConnector | None = None  # shared by authed sessions
+        # Bounds in-flight requests so gathered probes cannot flood the server
+        self._sem = asyncio.Semaphore(16)
+
+    @contextlib.asynccontextmanager
+    async def open_session(self):
+        """Open the shared session; one connection pool serves every request"""
+        # Resolve the host once per run; c-ares avoids the thread-pool lookup
+        self._connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=32,
+            resolver=aiohttp.AsyncResolver() if aiodns is not None else None,
+            use_dns_cache=True,
+            ttl_dns_cache=3600,
+            enable_cleanup_closed=True
+        )
+        async with aiohttp.ClientSession(
+            base_url=self.base_url,
+            connector=self._connector,
+            json_serialize=_orjson_dumps,
+            timeout=REQUEST_TIMEOUT
+        ) as self.session:
+            yield self.session
 
     async def run_all_tests(self):
         """Run all document endpoint tests"""
-        print("🧪 Testing Documents Endpoints")
-        print("=" * 50)
+        async with self.open_session():
+            print("🧪 Testing Documents Endpoints")
+            print("=" * 50)
         
-        # Test OPTIONS endpoints first
-        await self.test_options_endpoints()
+            if not await self._server_reachable():
+                print(f"❌ Server at {self.base_url} is unreachable")
+                return False
         
-        # Test authentication
-        await self.test_authentication()
+            # Test OPTIONS endpoints first
+            await self.test_options_endpoints()
         
-        if not self.auth_token:
-            print("❌ Cannot continue without authentication")
-            return False
+            # Test authentication
+            await self.test_authentication()
+        
+            if not self.auth_token:
+                self._print_summary()
+                print("❌ Cannot continue without authentication")
+                return False
             
-        # Test document endpoints
-        await self.test_document_endpoints()
+            # Test document endpoints
+            await self.test_document_endpoints()
         
-        # Test admin document endpoints
-        if self.admin_token:
-            await self.test_admin_document_endpoints()
-        else:
-            print("⚠️  Skipping admin tests - no admin token")
+            # Test admin document endpoints
+            if not self.run_admin:
+                print("⚠️  Skipping admin tests - disabled")
+            elif self.admin_token:
+                await self.test_admin_document_endpoints()
+            else:
+                print("⚠️  Skipping admin tests - no admin token")
         
-        print("✅ Documents endpoint tests completed")
-        return True
+            self._print_summary()
+            print("✅ Documents endpoint tests completed")
+            return True
+
+    async def _server_reachable(self) -> bool:
+        """One quick request up front; any HTTP response means the server is up"""
+        try:
+            async with self.session.get("/", timeout=PREFLIGHT_TIMEOUT):
+                return True
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            # Refused, reset or dropped mid-response: not usable either way
+            return False
+
+    def _authed_session(self, token: str) -> aiohttp.ClientSession:
+        """Session with the bearer token pinned, reusing the shared connection pool"""
+        return aiohttp.ClientSession(
+            base_url=self.base_url,
+            connector=self._connector,
+            connector_owner=False,
+            headers={"Authorization": f"Bearer {token}"},
+            json_serialize=_orjson_dumps,
+            timeout=REQUEST_TIMEOUT
+        )
+
+    @contextlib.asynccontextmanager
+    async def _request(self, method: str, url: str, *, session=None, **kwargs):
+        """Issue one request (on the shared session by default), holding a concurrency slot"""
+        async with self._sem:
+            async with (session or self.session).request(method, url, **kwargs) as response:
+                yield response
 
     async def test_options_endpoints(self):
         """Test OPTIONS endpoints for CORS preflight"""
-        print("\n🔍 Testing OPTIONS endpoints...")
-        
-        options_endpoints = [
-            "/documents",
-            "/documents/1",  # Test with a document ID
-            "/documents/1/download"
-        ]
+        self._log("\n🔍 Testing OPTIONS endpoints...")
         
-        async with aiohttp.ClientSession() as session:
-            for endpoint in options_endpoints:
-                try:
-                    async with session.options(f"{self.base_url}{endpoint}") as response:
-                        if response.status == 200:
-                            print(f"  ✅ OPTIONS {endpoint} - {response.status}")
-                        else:
-                            print(f"  ❌ OPTIONS {endpoint} - {response.status}")
-                except Exception as e:
-                    print(f"  ❌ OPTIONS {endpoint} - Error: {e}")
+        # Preflight probes are independent, so issue them concurrently
+        await asyncio.gather(
+            *(self._probe_options(endpoint) for endpoint in self.OPTIONS_ENDPOINTS),
+            return_exceptions=True
+        )
+
+    async def _call(self, method: str, path: str, *, expect_json: bool = True, **kwargs):
+        """Send one request and return (ok, status, body); errors become (False, None, exc)"""
+        try:
+            async with self._request(method, path, **kwargs) as response:
+                ok = response.status == 200
+                if ok and expect_json:
+                    return ok, response.status, await response.json(loads=orjson.loads)
+                # Body is unused: hand the connection back to the pool right away
+                response.release()
+                return ok, response.status, None
+        except Exception as e:
+            return False, None, e
+
+    def _log(self, message: str):
+        """Print progress output only in verbose mode"""
+        if self.verbose:
+            print(message)
+
+    def _print_summary(self):
+        """Print one line with pass/fail counts per request kind"""
+        print("📊 " + ", ".join(
+            f"{kind}: {passed} passed, {failed} failed"
+            for kind, (passed, failed) in self.results.items()
+        ))
+
+    def _report(self, kind: str, label: str, ok: bool, status, detail=None) -> bool:
+        """Count one result under kind; the line is only formatted in verbose mode"""
+        passed, failed = self.results[kind]
+        self.results[kind] = (passed + 1, failed) if ok else (passed, failed + 1)
+        if not self.verbose:
+            return ok
+        if ok:
+            print(f"    ✅ {label} - {status}" + (f" ({detail})" if detail else ""))
+        elif status is None:
+            print(f"    ❌ {label} error: {detail}")
+        else:
+            print(f"    ❌ {label} - {status}")
+        return ok
+
+    async def _probe_options(self, endpoint: str):
+        """Send one OPTIONS request and report its status"""
+        ok, status, body = await self._call("OPTIONS", endpoint, expect_json=False)
+        self._report("options", f"OPTIONS {endpoint}", ok, status, None if ok else body)
 
     async def test_authentication(self):
         """Test user authentication"""
-        print("\n🔐 Testing authentication...")
-        
-        # Test user login
-        await self.test_user_login()
+        self._log("\n🔐 Testing authentication...")
         
-        # Test admin login
-        await self.test_admin_login()
+        # User and admin logins set independent tokens, so run them together
+        if self.run_admin:
+            await asyncio.gather(self.test_user_login(), self.test_admin_login())
+        else:
+            await self.test_user_login()
 
     async def test_user_login(self):
         """Test user login"""
-        print("  Testing user login...")
-        
-        login_data = {
-            "username": "testuser",
-            "password": "testpassword123"
-        }
-        
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(
-                    f"{self.base_url}/login",
-                    json=login_data
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        self.auth_token = data.get("access_token")
-                        print(f"    ✅ User login successful")
-                        return True
-                    else:
-                        print(f"    ❌ User login failed: {response.status}")
-                        return False
-            except Exception as e:
-                print(f"    ❌ User login error: {e}")
-                return False
+        self._log("  Testing user login...")
+        ok, status, body = await self._call(
+            "POST", "/login", data=self._USER_LOGIN_BODY, headers=JSON_HEADERS
+        )
+        if ok:
+            self.auth_token = body.get("access_token")
+        return self._report("auth", "User login", ok, status, None if ok else body)
 
     async def test_admin_login(self):
         """Test admin login"""
-        print("  Testing admin login...")
-        
-        admin_data = {
-            "username": "admin",
-            "password": "admin123"
-        }
-        
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(
-                    f"{self.base_url}/login",
-                    json=admin_data
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        self.admin_token = data.get("access_token")
-                        print(f"    ✅ Admin login successful")
-                        return True
-                    else:
-                        print(f"    ❌ Admin login failed: {response.status}")
-                        return False
-            except Exception as e:
-                print(f"    ❌ Admin login error: {e}")
-                return False
+        self._log("  Testing admin login...")
+        ok, status, body = await self._call(
+            "POST", "/login", data=self._ADMIN_LOGIN_BODY, headers=JSON_HEADERS
+        )
+        if ok:
+            self.admin_token = body.get("access_token")
+        return self._report("auth", "Admin login", ok, status, None if ok else body)
 
     async def test_document_endpoints(self):
         """Test document management endpoints"""
-        print("\n📄 Testing document endpoints...")
+        self._log("\n📄 Testing document endpoints...")
         
-        headers = {"Authorization": f"Bearer {self.auth_token}"}
-        
-        async with aiohttp.ClientSession() as session:
+        async with self._authed_session(self.auth_token) as session:
             # Test document upload
-            await self.test_document_upload(session, headers)
-            
-            # Test get user documents
-            await self.test_get_user_documents(session, headers)
+            await self.test_document_upload(session)
             
-            # Test get document by ID
             if self.test_document_id:
-                await self.test_get_document_by_id(session, headers)
-                
-                # Test document download
-                await self.test_document_download(session, headers)
+                # Listing, get by ID and download only read the new document
+                await asyncio.gather(
+                    self.test_get_user_documents(session),
+                    self.test_get_document_by_id(session),
+                    self.test_document_download(session)
+                )
                 
-                # Test document deletion
-                await self.test_document_deletion(session, headers)
+                # Test document deletion; must follow every read
+                await self.test_document_deletion(session)
+            else:
+                # Test get user documents
+                await self.test_get_user_documents(session)
 
-    async def test_document_upload(self, session, headers):
+    async def test_document_upload(self, session):
         """Test document upload"""
-        print("  Testing document upload...")
-        
-        # Create a simple text document
-        document_content = "This is a test document for API testing."
-        document_base64 = base64.b64encode(document_content.encode()).decode()
-        
-        document_data = {
-            "file_name": "test_document.txt",
-            "file_data": document_base64,
-            "category": "test",
-            "description": "Test document for API testing"
-        }
-        
-        try:
-            async with session.post(
-                f"{self.base_url}/documents",
-                json=document_data,
-                headers=headers
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    self.test_document_id = data.get("id")
-                    print(f"    ✅ Document upload successful - ID: {self.test_document_id}")
-                    return True
-                else:
-                    print(f"    ❌ Document upload failed: {response.status}")
-                    return False
-        except Exception as e:
-            print(f"    ❌ Document upload error: {e}")
-            return False
+        self._log("  Testing document upload...")
+        ok, status, body = await self._call(
+            "POST", "/documents", data=self._DOCUMENT_BODY, headers=JSON_HEADERS, session=session
+        )
+        if ok:
+            self.test_document_id = body.get("id")
+        return self._report("documents", "Document upload", ok, status, f"ID: {self.test_document_id}" if ok else body)
 
-    async def test_get_user_documents(self, session, headers):
+    async def test_get_user_documents(self, session):
         """Test get user documents"""
-        print("  Testing get user documents...")
-        
-        try:
-            async with session.get(
-                f"{self.base_url}/documents",
-                headers=headers
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    print(f"    ✅ GET /documents - {response.status} ({len(data)} documents)")
-                    return True
-                else:
-                    print(f"    ❌ GET /documents - {response.status}")
-                    return False
-        except Exception as e:
-            print(f"    ❌ GET /documents error: {e}")
-            return False
+        self._log("  Testing get user documents...")
+        ok, status, body = await self._call("GET", "/documents", session=session)
+        return self._report("documents", "GET /documents", ok, status, f"{len(body)} documents" if ok else body)
 
-    async def test_get_document_by_id(self, session, headers):
+    async def test_get_document_by_id(self, session):
         """Test get document by ID"""
-        print("  Testing get document by ID...")
-        
-        try:
-            async with session.get(
-                f"{self.base_url}/documents/{self.test_document_id}",
-                headers=headers
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    print(f"    ✅ GET /documents/{self.test_document_id} - {response.status}")
-                    return True
-                else:
-                    print(f"    ❌ GET /documents/{self.test_document_id} - {response.status}")
-                    return False
-        except Exception as e:
-            print(f"    ❌ GET /documents/{self.test_document_id} error: {e}")
-            return False
+        self._log("  Testing get document by ID...")
+        path = f"/documents/{self.test_document_id}"
+        ok, status, body = await self._call("GET", path, session=session)
+        return self._report("documents", f"GET {path}", ok, status, None if ok else body)
 
-    async def test_document_download(self, session, headers):
+    async def test_document_download(self, session):
         """Test document download"""
-        print("  Testing document download...")
+        self._log("  Testing document download...")
         
         try:
-            async with session.get(
-                f"{self.base_url}/documents/{self.test_document_id}/download",
-                headers=headers
+            async with self._request(
+                "GET",
+                f"/documents/{self.test_document_id}/download",
+                session=session
             ) as response:
-                if response.status == 200:
-                    content = await response.read()
-                    print(f"    ✅ Document download - {response.status} ({len(content)} bytes)")
-                    return True
-                else:
-                    print(f"    ❌ Document download - {response.status}")
-                    return False
+                if response.status != 200:
+                    response.release()
+                    return self._report("documents", "Document download", False, response.status)
+                # Count bytes chunk by chunk instead of buffering the whole body
+                total = 0
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    total += len(chunk)
+                return self._report("documents", "Document download", True, response.status, f"{total} bytes")
         except Exception as e:
-            print(f"    ❌ Document download error: {e}")
-            return False
+            return self._report("documents", "Document download", False, None, e)
 
-    async def test_document_deletion(self, session, headers):
+    async def test_document_deletion(self, session):
         """Test document deletion"""
-        print("  Testing document deletion...")
-        
-        try:
-            async with session.delete(
-                f"{self.base_url}/documents/{self.test_document_id}",
-                headers=headers
-            ) as response:
-                if response.status == 200:
-                    print(f"    ✅ Document deletion - {response.status}")
-                    return True
-                else:
-                    print(f"    ❌ Document deletion - {response.status}")
-                    return False
-        except Exception as e:
-            print(f"    ❌ Document deletion error: {e}")
-            return False
+        self._log("  Testing document deletion...")
+        path = f"/documents/{self.test_document_id}"
+        ok, status, body = await self._call("DELETE", path, expect_json=False, session=session)
+        return self._report("documents", "Document deletion", ok, status, None if ok else body)
 
     async def test_admin_document_endpoints(self):
         """Test admin document endpoints"""
-        print("\n👑 Testing admin document endpoints...")
-        
-        headers = {"Authorization": f"Bearer {self.admin_token}"}
+        self._log("\n👑 Testing admin document endpoints...")
         
-        async with aiohttp.ClientSession() as session:
-            # Test get all documents (admin)
-            try:
-                async with session.get(
-                    f"{self.base_url}/admin/documents",
-                    headers=headers
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        print(f"    ✅ GET /admin/documents - {response.status} ({len(data)} documents)")
-                    else:
-                        print(f"    ❌ GET /admin/documents - {response.status}")
-            except Exception as e:
-                print(f"    ❌ GET /admin/documents error: {e}")
-            
-            # Test get documents by category
-            try:
-                async with session.get(
-                    f"{self.base_url}/admin/documents?category=test",
-                    headers=headers
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        print(f"    ✅ GET /admin/documents?category=test - {response.status}")
-                    else:
-                        print(f"    ❌ GET /admin/documents?category=test - {response.status}")
-            except Exception as e:
-                print(f"    ❌ GET /admin/documents?category=test error: {e}")
-
-
-async def main():
-    """Main test function"""
+        # Both admin listings are read-only, so fetch them concurrently
+        async with self._authed_session(self.admin_token) as session:
+            await asyncio.gather(
+                self._get_admin_documents(session),
+                self._get_admin_documents_by_category(session)
+            )
+
+    async def _get_admin_documents(self, session):
+        """Test get all documents (admin)"""
+        ok, status, body = await self._call("GET", "/admin/documents", session=session)
+        return self._report("admin", "GET /admin/documents", ok, status, f"{len(body)} documents" if ok else body)
+
+    async def _get_admin_documents_by_category(self, session):
+        """Test get documents by category (admin)"""
+        ok, status, body = await self._call(
+            "GET", "/admin/documents", params={"category": "test"}, session=session
+        )
+        return self._report("admin", "GET /admin/documents?category=test", ok, status, None if ok else body)
+
+
+# ============================================================================
+# pytest entry points
+# ============================================================================
+# Each check below is independent once the session fixtures are set up, so the
+# module can be spread across workers; run_all_tests() remains the script path.
+# They hit a live backend and write real data, so they only run with -m integration.
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture(scope="session")
+async def documents_tester():
+    """Tester with an open shared session and both logins done once"""
     tester = TestDocumentsEndpoints()
+    async with tester.open_session():
+        if not await tester._server_reachable():
+            pytest.skip(f"Backend at {tester.base_url} is not reachable")
+        await tester.test_authentication()
+        yield tester
+
+
+@pytest.fixture(scope="session")
+async def documents_user_session(documents_tester):
+    """Session with the user's bearer token pinned"""
+    if not documents_tester.auth_token:
+        pytest.skip("User login failed")
+    async with documents_tester._authed_session(documents_tester.auth_token) as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+async def documents_admin_session(documents_tester):
+    """Session with the admin's bearer token pinned"""
+    if not documents_tester.admin_token:
+        pytest.skip("Admin login failed")
+    async with documents_tester._authed_session(documents_tester.admin_token) as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+async def uploaded_document_id(documents_tester, documents_user_session):
+    """Upload one document for the read-only checks and delete it afterwards"""
+    assert await documents_tester.test_document_upload(documents_user_session)
+    yield documents_tester.test_document_id
+    await documents_tester.test_document_deletion(documents_user_session)
+
+
+@pytest.mark.parametrize("endpoint", TestDocumentsEndpoints.OPTIONS_ENDPOINTS)
+async def test_documents_options(documents_tester, endpoint):
+    ok, status, _ = await documents_tester._call("OPTIONS", endpoint, expect_json=False)
+    assert ok, f"OPTIONS {endpoint} returned {status}"
+
+
+async def test_get_user_documents(documents_tester, documents_user_session):
+    assert await documents_tester.test_get_user_documents(documents_user_session)
+
+
+async def test_get_document_by_id(documents_tester, documents_user_session, uploaded_document_id):
+    assert await documents_tester.test_get_document_by_id(documents_user_session)
+
+
+async def test_document_download(documents_tester, documents_user_session, uploaded_document_id):
+    assert await documents_tester.test_document_download(documents_user_session)
+
+
+async def test_admin_documents(documents_tester, documents_admin_session):
+    assert await documents_tester._get_admin_documents(documents_admin_session)
+
+
+async def test_admin_documents_by_category(documents_tester, documents_admin_session):
+    assert await documents_tester._get_admin_documents_by_category(documents_admin_session)
+
+
+async def main(verbose: bool = False, run_admin: bool = True):
+    """Main test function"""
+    tester = TestDocumentsEndpoints(verbose=verbose, run_admin=run_admin)
     success = await tester.run_all_tests()
     
     if success:
@@ -312,4 +422,16 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Test documents endpoints")
+    parser.add_argument("--verbose", action="store_true", help="Print a line per request")
+    parser.add_argument("--skip-admin", action="store_true", help="Skip admin login and admin tests")
+    args = parser.parse_args()
+
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:  # uvloop has no Windows support; use the stock loop
+        loop_factory = None
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main(args.verbose, run_admin=not args.skip_admin))
@@ -6,139 +6,162 @@ import pytest
 import httpx
 import asyncio
 from unittest.mock import patch, AsyncMock
-from tests.test_config import BASE_URL, CALCULATOR_URL
 from tests.test_helpers import (
     generate_test_file_upload,
     generate_test_calculation_data,
-    validate_error_response,
+    assert_status,
     encode_file_to_base64,
+    make_order_payload,
 )
 
+# Fixed upload payloads, encoded once at import rather than per test run
+_CORRUPTED_STL_B64 = encode_file_to_base64(b"corrupted file content")
+_EMPTY_B64 = encode_file_to_base64(b"")
+_LARGE_1MB_B64 = encode_file_to_base64(b"x" * (1024 * 1024))  # 1MB sample
+_INVALID_STL_B64 = encode_file_to_base64(b"invalid stl content")
+_UNSUPPORTED_B64 = [
+    (filename, encode_file_to_base64(content))
+    for filename, content in [
+        ("malware.exe", b"MZ executable"),
+        ("script.sh", b"#!/bin/bash\nrm -rf /"),
+        ("image.bmp", b"BM image data"),
+    ]
+]
+
+# Concurrent deletes of one file in test_concurrent_file_deletion
+_CONCURRENT_DELETES = 16
+
+
+def _order_data(file_id):
+    """Fresh order body for the order tests; nested lists are never shared"""
+    return make_order_payload(
+        file_id=file_id,
+        tolerance_id="1",
+        finish_id="1",
+        k_otk="1",
+        k_cert=["a"],
+    )
+
+
+@pytest.fixture
+async def invalid_stl_upload(http_client, user_auth_headers):
+    """Upload an unparsable STL, return the response and delete the file after"""
+    response = await http_client.post(
+        "/files",
+        json={
+            "file_name": "test.stl",
+            "file_data": _INVALID_STL_B64
+        },
+        headers=user_auth_headers
+    )
+    
+    yield response
+    
+    # Cleanup: delete file after test, if the upload was accepted
+    if response.status_code == 200:
+        file_id = response.json()["id"]
+        try:
+            await http_client.delete(
+                f"/files/{file_id}",
+                headers=user_auth_headers
+            )
+        except Exception as e:
+            print(f"Warning: Failed to cleanup file {file_id}: {e}")
+
 
 @pytest.mark.unit
 class TestInvalidFileHandling:
     """Test handling of invalid and corrupted files"""
     
     @pytest.mark.asyncio
-    async def test_upload_corrupted_stl_file(self, http_client, user_account):
+    async def test_upload_corrupted_stl_file(self, http_client, user_auth_headers):
         """Test upload of corrupted STL file"""
-        user_data, token = user_account
-        
-        # Corrupted STL content
-        corrupted_stl = b"corrupted file content"
-        
         response = await http_client.post(
-            f"{BASE_URL}/files",
+            "/files",
             json={
                 "file_name": "corrupted.stl",
-                "file_data": encode_file_to_base64(corrupted_stl)
+                "file_data": _CORRUPTED_STL_B64
             },
-            headers={"Authorization": f"Bearer {token}"}
+            headers=user_auth_headers
         )
         # Should either accept (with warning) or reject
         assert response.status_code in [200, 400, 422]
     
     @pytest.mark.asyncio
-    async def test_upload_empty_file(self, http_client, user_account):
+    async def test_upload_empty_file(self, http_client, user_auth_headers):
         """Test upload of empty file"""
-        user_data, token = user_account
-        
         response = await http_client.post(
-            f"{BASE_URL}/files",
+            "/files",
             json={
                 "file_name": "empty.stl",
-                "file_data": encode_file_to_base64(b"")
+                "file_data": _EMPTY_B64
             },
-            headers={"Authorization": f"Bearer {token}"}
+            headers=user_auth_headers
         )
-        validate_error_response(response, 422)
+        assert_status(response, 422)
     
     @pytest.mark.asyncio
-    async def test_upload_oversized_file(self, http_client, user_account):
+    async def test_upload_oversized_file(self, http_client, user_auth_headers):
         """Test upload of file exceeding size limit"""
-        user_data, token = user_account
-        
-        # Create a large file (simulate 100MB)
-        # Note: We don't actually send 100MB, just test the validation
-        large_content = b"x" * (1024 * 1024)  # 1MB sample
-        
+        # Simulates an oversized upload; we don't actually send 100MB,
+        # just test the validation with a 1MB sample
         response = await http_client.post(
-            f"{BASE_URL}/files",
+            "/files",
             json={
                 "file_name": "large.stl",
-                "file_data": encode_file_to_base64(large_content)
+                "file_data": _LARGE_1MB_B64
             },
-            headers={"Authorization": f"Bearer {token}"}
+            headers=user_auth_headers
         )
         # Should accept if under limit
         assert response.status_code in [200, 400, 413, 422]
     
     @pytest.mark.asyncio
-    async def test_upload_unsupported_file_type(self, http_client, user_account):
+    @pytest.mark.parametrize(
+        "filename,file_data", _UNSUPPORTED_B64, ids=[name for name, _ in _UNSUPPORTED_B64]
+    )
+    async def test_upload_unsupported_file_type(
+        self, http_client, user_auth_headers, filename, file_data
+    ):
         """Test upload of unsupported file type"""
-        user_data, token = user_account
-        
-        unsupported_files = [
-            ("malware.exe", b"MZ executable"),
-            ("script.sh", b"#!/bin/bash\nrm -rf /"),
-            ("image.bmp", b"BM image data"),
-        ]
-        
-        for filename, content in unsupported_files:
-            response = await http_client.post(
-                f"{BASE_URL}/files",
-                json={
-                    "file_name": filename,
-                    "file_data": encode_file_to_base64(content)
-                },
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            assert response.status_code in [400, 422], \
-                f"Unsupported file type should be rejected: {filename}"
+        response = await http_client.post(
+            "/files",
+            json={
+                "file_name": filename,
+                "file_data": file_data
+            },
+            headers=user_auth_headers
+        )
+        assert response.status_code in [400, 422], \
+            f"Unsupported file type should be rejected: {filename}"
     
     @pytest.mark.asyncio
-    async def test_download_nonexistent_file(self, http_client, user_account):
+    async def test_download_nonexistent_file(self, http_client, user_auth_headers):
         """Test downloading a file that doesn't exist"""
-        user_data, token = user_account
-        
         response = await http_client.get(
-            f"{BASE_URL}/files/999999/download",
-            headers={"Authorization": f"Bearer {token}"}
+            "/files/999999/download",
+            headers=user_auth_headers
         )
-        validate_error_response(response, 404)
+        assert_status(response, 404)
     
     @pytest.mark.asyncio
-    async def test_preview_generation_failure(self, http_client, user_account):
+    async def test_preview_generation_failure(
+        self, http_client, user_auth_headers, invalid_stl_upload
+    ):
         """Test handling of preview generation failure"""
-        user_data, token = user_account
-        
-        # Upload a file that might fail preview generation
-        response = await http_client.post(
-            f"{BASE_URL}/files",
-            json={
-                "file_name": "test.stl",
-                "file_data": encode_file_to_base64(b"invalid stl content")
-            },
-            headers={"Authorization": f"Bearer {token}"}
-        )
+        # Upload of a file that might fail preview generation
+        response = invalid_stl_upload
         
         if response.status_code == 200:
-            file_data = response.json()
-            file_id = file_data["id"]
+            file_id = response.json()["id"]
             
             # Try to get preview
             response = await http_client.get(
-                f"{BASE_URL}/files/{file_id}/preview",
-                headers={"Authorization": f"Bearer {token}"}
+                f"/files/{file_id}/preview",
+                headers=user_auth_headers
             )
             # Should either return placeholder or error
             assert response.status_code in [200, 404, 500]
-            
-            # Cleanup
-            await http_client.delete(
-                f"{BASE_URL}/files/{file_id}",
-                headers={"Authorization": f"Bearer {token}"}
-            )
 
 
 @pytest.mark.unit
@@ -152,34 +175,27 @@ class TestCalculatorServiceErrors:
         calc_data["material_id"] = "invalid_material"
         
         response = await http_client.post(
-            f"{BASE_URL}/calculate-price",
+            "/calculate-price",
             json=calc_data
         )
         assert response.status_code in [400, 422]
     
     @pytest.mark.asyncio
-    @pytest.mark.integration
-    @pytest.mark.requires_calculator
     async def test_calculator_service_timeout(
-        self, http_client, skip_if_calculator_unavailable
+        self, http_client, mock_calculator_timeout
     ):
         """Test handling of calculator service timeout"""
         calc_data = generate_test_calculation_data()
         
-        # Set very short timeout to simulate timeout
-        async with httpx.AsyncClient(timeout=0.001) as quick_client:
-            try:
-                response = await quick_client.post(
-                    f"{BASE_URL}/calculate-price",
-                    json=calc_data
-                )
-                # If it completes, that's also acceptable
-                assert response.status_code in [200, 400, 500, 504]
-            except httpx.TimeoutException:
-                # Timeout is expected
-                pass
+        response = await http_client.post(
+            "/calculate-price",
+            json=calc_data
+        )
+        # Upstream timeout is reported as the calculator being unavailable
+        assert response.status_code in [502, 504]
     
     @pytest.mark.asyncio
+    @pytest.mark.exploratory
     async def test_calculation_missing_dimensions(self, http_client):
         """Test calculation with missing dimensions"""
         calc_data = generate_test_calculation_data()
@@ -188,20 +204,21 @@ class TestCalculatorServiceErrors:
         del calc_data["height"]
         
         response = await http_client.post(
-            f"{BASE_URL}/calculate-price",
+            "/calculate-price",
             json=calc_data
         )
         # Should fail if dimensions required, or accept if file analysis available
         assert response.status_code in [200, 422]
     
     @pytest.mark.asyncio
+    @pytest.mark.exploratory
     async def test_calculation_with_conflicting_parameters(self, http_client):
         """Test calculation with conflicting parameters"""
         calc_data = generate_test_calculation_data("printing")
         calc_data["material_id"] = "alum_D16"  # Metal for 3D printing (conflict)
         
         response = await http_client.post(
-            f"{BASE_URL}/calculate-price",
+            "/calculate-price",
             json=calc_data
         )
         # Should either reject or handle gracefully
@@ -213,38 +230,23 @@ class TestDatabaseErrors:
     """Test handling of database-related errors"""
     
     @pytest.mark.asyncio
+    @pytest.mark.xdist_group("orders")
     async def test_duplicate_order_submission(
-        self, http_client, user_account, uploaded_file
+        self, http_client, user_auth_headers, uploaded_file
     ):
         """Test handling of duplicate order submission"""
-        user_data, token = user_account
-        
-        order_data = {
-            "service_id": "cnc-milling",
-            "file_id": uploaded_file,
-            "quantity": 1,
-            "material_id": "alum_D16",
-            "length": 100,
-            "width": 50,
-            "height": 25,
-            "tolerance_id": "1",
-            "finish_id": "1",
-            "k_otk": "1",
-            "k_cert": ["a"]
-        }
-        
-        # Submit order twice rapidly
-        response1 = await http_client.post(
-            f"{BASE_URL}/orders",
-            json=order_data,
-            headers={"Authorization": f"Bearer {token}"}
-        )
+        order_data = _order_data(uploaded_file)
         
-        response2 = await http_client.post(
-            f"{BASE_URL}/orders",
+        # Submit the same prebuilt request twice rapidly; in order, so the
+        # first submission is the one expected to succeed
+        request = http_client.build_request(
+            "POST",
+            "/orders",
             json=order_data,
-            headers={"Authorization": f"Bearer {token}"}
+            headers=user_auth_headers
         )
+        response1 = await http_client.send(request)
+        response2 = await http_client.send(request)
         
         # Both should succeed (no duplicate constraint) or second should fail
         assert response1.status_code == 200
@@ -252,75 +254,74 @@ class TestDatabaseErrors:
     
     @pytest.mark.asyncio
     async def test_concurrent_file_deletion(
-        self, http_client, user_account, test_file_upload
+        self, http_client, user_auth_headers, test_file_upload
     ):
         """Test concurrent deletion of the same file"""
-        user_data, token = user_account
-        
         # Upload file
         response = await http_client.post(
-            f"{BASE_URL}/files",
+            "/files",
             json=test_file_upload,
-            headers={"Authorization": f"Bearer {token}"}
+            headers=user_auth_headers
         )
         assert response.status_code == 200
         file_id = response.json()["id"]
         
-        # Try to delete twice concurrently
-        delete_tasks = [
-            http_client.delete(
-                f"{BASE_URL}/files/{file_id}",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            for _ in range(2)
-        ]
-        
-        responses = await asyncio.gather(*delete_tasks, return_exceptions=True)
-        
-        # First should succeed, second should fail with 404
-        success_count = sum(1 for r in responses if isinstance(r, httpx.Response) and r.status_code == 200)
-        assert success_count >= 1, "At least one deletion should succeed"
+        # Race several sends of one prebuilt delete to widen the window
+        request = http_client.build_request(
+            "DELETE",
+            f"/files/{file_id}",
+            headers=user_auth_headers
+        )
+        transport_errors = ()
+        try:
+            async with asyncio.TaskGroup() as tg:
+                delete_tasks = [
+                    tg.create_task(http_client.send(request))
+                    for _ in range(_CONCURRENT_DELETES)
+                ]
+        except* httpx.HTTPError as eg:
+            transport_errors = eg.exceptions
+        # Transport failures are test failures, not "lost the race" 404s
+        if transport_errors:
+            pytest.fail(f"Concurrent deletes hit transport errors: {transport_errors!r}")
+        statuses = sorted(task.result().status_code for task in delete_tasks)
+        
+        # The delete path has no row locking, so several requests may pass the
+        # existence check before the first commit; only require that one won,
+        # none crashed, and the file is gone afterwards
+        assert 200 in statuses, f"No deletion succeeded: {statuses}"
+        assert all(status < 500 for status in statuses), f"Concurrent deletes errored: {statuses}"
+        response = await http_client.get(f"/files/{file_id}", headers=user_auth_headers)
+        assert response.status_code == 404
     
     @pytest.mark.asyncio
+    @pytest.mark.xdist_group("orders")
+    @pytest.mark.exploratory
     async def test_orphaned_order_handling(
-        self, http_client, user_account, uploaded_file
+        self, http_client, user_auth_headers, uploaded_file
     ):
         """Test handling of orders with deleted files"""
-        user_data, token = user_account
-        
         # Create order
-        order_data = {
-            "service_id": "cnc-milling",
-            "file_id": uploaded_file,
-            "quantity": 1,
-            "material_id": "alum_D16",
-            "length": 100,
-            "width": 50,
-            "height": 25,
-            "tolerance_id": "1",
-            "finish_id": "1",
-            "k_otk": "1",
-            "k_cert": ["a"]
-        }
+        order_data = _order_data(uploaded_file)
         
         response = await http_client.post(
-            f"{BASE_URL}/orders",
+            "/orders",
             json=order_data,
-            headers={"Authorization": f"Bearer {token}"}
+            headers=user_auth_headers
         )
         assert response.status_code == 200
         order_id = response.json()["order_id"]
         
         # Delete the file
         response = await http_client.delete(
-            f"{BASE_URL}/files/{uploaded_file}",
-            headers={"Authorization": f"Bearer {token}"}
+            f"/files/{uploaded_file}",
+            headers=user_auth_headers
         )
         
         # Try to access the order
         response = await http_client.get(
-            f"{BASE_URL}/orders/{order_id}",
-            headers={"Authorization": f"Bearer {token}"}
+            f"/orders/{order_id}",
+            headers=user_auth_headers
         )
         # Should still return order, possibly with missing file info
         assert response.status_code in [200, 404]
@@ -331,17 +332,15 @@ class TestNetworkErrors:
     """Test handling of network-related errors"""
     
     @pytest.mark.asyncio
-    async def test_request_with_invalid_json(self, http_client, user_account):
+    async def test_request_with_invalid_json(self, http_client, user_auth_headers):
         """Test request with malformed JSON"""
-        user_data, token = user_account
-        
         # Send invalid JSON
         try:
             response = await http_client.post(
-                f"{BASE_URL}/files",
+                "/files",
                 content=b"{invalid json}",
                 headers={
-                    "Authorization": f"Bearer {token}",
+                    **user_auth_headers,
                     "Content-Type": "application/json"
                 }
             )
@@ -353,16 +352,14 @@ class TestNetworkErrors:
     
     @pytest.mark.asyncio
     async def test_request_with_wrong_content_type(
-        self, http_client, user_account
+        self, http_client, user_auth_headers
     ):
         """Test request with wrong Content-Type header"""
-        user_data, token = user_account
-        
         response = await http_client.post(
-            f"{BASE_URL}/files",
+            "/files",
             content=b"plain text content",
             headers={
-                "Authorization": f"Bearer {token}",
+                **user_auth_headers,
                 "Content-Type": "text/plain"
             }
         )
@@ -370,23 +367,22 @@ class TestNetworkErrors:
         assert response.status_code in [400, 415, 422]
     
     @pytest.mark.asyncio
-    @pytest.mark.slow
-    async def test_very_slow_request(self, http_client, user_account):
+    @pytest.mark.integration
+    async def test_very_slow_request(self, http_client_real, real_user_token):
         """Test handling of very slow requests"""
-        user_data, token = user_account
-        
-        # Use very short timeout
-        async with httpx.AsyncClient(timeout=0.001) as quick_client:
-            try:
-                response = await quick_client.get(
-                    f"{BASE_URL}/files",
-                    headers={"Authorization": f"Bearer {token}"}
-                )
-                # If it completes quickly, that's fine
-                assert response.status_code == 200
-            except httpx.TimeoutException:
-                # Timeout is expected
-                pass
+        # Use very short timeout; needs a socket transport, since the
+        # in-process ASGITransport ignores timeout=
+        try:
+            response = await http_client_real.get(
+                "/files",
+                headers={"Authorization": f"Bearer {real_user_token}"},
+                timeout=0.001
+            )
+            # If it completes quickly, that's fine
+            assert response.status_code == 200
+        except httpx.TimeoutException:
+            # Timeout is expected
+            pass
 
 
 @pytest.mark.unit
@@ -395,32 +391,30 @@ class TestEdgeCases:
     
     @pytest.mark.asyncio
     async def test_access_deleted_resource(
-        self, http_client, user_account, test_file_upload
+        self, http_client, user_auth_headers, test_file_upload
     ):
         """Test accessing a resource after it's deleted"""
-        user_data, token = user_account
-        
         # Upload and delete file
         response = await http_client.post(
-            f"{BASE_URL}/files",
+            "/files",
             json=test_file_upload,
-            headers={"Authorization": f"Bearer {token}"}
+            headers=user_auth_headers
         )
         assert response.status_code == 200
         file_id = response.json()["id"]
         
         response = await http_client.delete(
-            f"{BASE_URL}/files/{file_id}",
-            headers={"Authorization": f"Bearer {token}"}
+            f"/files/{file_id}",
+            headers=user_auth_headers
         )
         assert response.status_code == 200
         
         # Try to access deleted file
         response = await http_client.get(
-            f"{BASE_URL}/files/{file_id}",
-            headers={"Authorization": f"Bearer {token}"}
+            f"/files/{file_id}",
+            headers=user_auth_headers
         )
-        validate_error_response(response, 404)
+        assert_status(response, 404)
     
     @pytest.mark.asyncio
     async def test_update_nonexistent_resource(
@@ -428,59 +422,53 @@ class TestEdgeCases:
     ):
         """Test updating a resource that doesn't exist"""
         response = await http_client.put(
-            f"{BASE_URL}/admin/orders/999999",
+            "/admin/orders/999999",
             json={"status": "completed"},
             headers={"Authorization": f"Bearer {admin_token}"}
         )
-        validate_error_response(response, 404)
+        assert_status(response, 404)
     
     @pytest.mark.asyncio
-    async def test_empty_list_responses(self, http_client, user_account):
+    @pytest.mark.xdist_group("fresh_user")
+    async def test_empty_list_responses(self, http_client, fresh_user_account):
         """Test endpoints that return empty lists"""
-        user_data, token = user_account
+        user_data, token = fresh_user_account
+        headers = {"Authorization": f"Bearer {token}"}
         
-        # New user should have no files
-        response = await http_client.get(
-            f"{BASE_URL}/files",
-            headers={"Authorization": f"Bearer {token}"}
+        files_response, orders_response = await asyncio.gather(
+            http_client.get("/files", headers=headers),
+            http_client.get("/orders", headers=headers),
         )
-        assert response.status_code == 200
-        files = response.json()
-        assert isinstance(files, list)
+        
+        # New user should have no files
+        assert files_response.status_code == 200
+        assert files_response.json() == []
         
         # New user should have no orders
-        response = await http_client.get(
-            f"{BASE_URL}/orders",
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        assert response.status_code == 200
-        orders = response.json()
-        assert isinstance(orders, list)
+        assert orders_response.status_code == 200
+        assert orders_response.json() == []
     
     @pytest.mark.asyncio
+    @pytest.mark.parametrize("invalid_id", ["abc", "123.456", "-1", "0x123", "../../etc"])
     async def test_special_characters_in_ids(
-        self, http_client, user_account
+        self, http_client, user_auth_headers, invalid_id
     ):
         """Test handling of special characters in resource IDs"""
-        user_data, token = user_account
-        
-        invalid_ids = ["abc", "123.456", "-1", "0x123", "../../etc"]
-        
-        for invalid_id in invalid_ids:
-            response = await http_client.get(
-                f"{BASE_URL}/files/{invalid_id}",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            # Should return 404 or 422
-            assert response.status_code in [404, 422]
+        response = await http_client.get(
+            f"/files/{invalid_id}",
+            headers=user_auth_headers
+        )
+        # Should return 404 or 422
+        assert response.status_code in [404, 422]
     
     @pytest.mark.asyncio
+    @pytest.mark.exploratory
     async def test_pagination_edge_cases(self, http_client, admin_token):
         """Test pagination with edge case parameters"""
         # Note: Implement if pagination is supported
         
         response = await http_client.get(
-            f"{BASE_URL}/users",
+            "/users",
             params={"page": -1, "limit": 0},
             headers={"Authorization": f"Bearer {admin_token}"}
         )
@@ -494,19 +482,17 @@ class TestErrorRecovery:
     
     @pytest.mark.asyncio
     async def test_failed_upload_cleanup(
-        self, http_client, user_account
+        self, http_client, user_auth_headers
     ):
         """Test that failed uploads clean up properly"""
-        user_data, token = user_account
-        
         # Try to upload invalid file
         response = await http_client.post(
-            f"{BASE_URL}/files",
+            "/files",
             json={
                 "file_name": "test.stl",
                 "file_data": "invalid_base64"
             },
-            headers={"Authorization": f"Bearer {token}"}
+            headers=user_auth_headers
         )
         
         # Should fail
@@ -514,29 +500,27 @@ class TestErrorRecovery:
         
         # Verify no orphaned files created
         response = await http_client.get(
-            f"{BASE_URL}/files",
-            headers={"Authorization": f"Bearer {token}"}
+            "/files",
+            headers=user_auth_headers
         )
         assert response.status_code == 200
         # File count should not include failed upload
     
     @pytest.mark.asyncio
     async def test_partial_order_creation_rollback(
-        self, http_client, user_account
+        self, http_client, user_auth_headers
     ):
         """Test rollback on partial order creation failure"""
-        user_data, token = user_account
-        
         # Try to create order with invalid data
         response = await http_client.post(
-            f"{BASE_URL}/orders",
+            "/orders",
             json={
                 "service_id": "cnc-milling",
                 "file_id": 999999,  # Nonexistent file
                 "quantity": 1,
                 "material_id": "alum_D16",
             },
-            headers={"Authorization": f"Bearer {token}"}
+            headers=user_auth_headers
         )
         
         # Should fail
@@ -544,8 +528,8 @@ class TestErrorRecovery:
         
         # Verify no partial order created
         response = await http_client.get(
-            f"{BASE_URL}/orders",
-            headers={"Authorization": f"Bearer {token}"}
+            "/orders",
+            headers=user_auth_headers
         )
         assert response.status_code == 200
         # Order count should not include failed creation
@@ -4,16 +4,51 @@ Tests file upload, download, preview, and management
 """
 import asyncio
 import httpx
-import base64
+from binascii import b2a_base64
 import json
+import orjson
+from typing import Optional
 
 BASE_URL = "http://localhost:8000"
 
+# Upload payloads, encoded once at import
+STL_FILE_DATA = b2a_base64(b"This is a test STL file content for modular API testing", newline=False).decode('ascii')
+STP_FILE_DATA = b2a_base64(b"This is a test STP file content for modular API testing", newline=False).decode('ascii')
+TXT_FILE_DATA = b2a_base64(b"test content", newline=False).decode('ascii')
+
+# Upload request bodies, serialized once and sent with content=
+JSON_HEADERS = {"Content-Type": "application/json"}
+STL_UPLOAD_BODY = orjson.dumps({
+    "file_name": "test_model.stl",
+    "file_data": STL_FILE_DATA,
+    "file_type": "stl"
+})
+STP_UPLOAD_BODY = orjson.dumps({
+    "file_name": "test_model.stp",
+    "file_data": STP_FILE_DATA,
+    "file_type": "stp",
+    "description": "Test STP model for modular API testing"
+})
+TXT_UPLOAD_BODY = orjson.dumps({
+    "file_name": "test.txt",
+    "file_data": TXT_FILE_DATA,
+    "file_type": "txt",
+    "description": "Invalid file type"
+})
+
+# Fail fast on connects and reads; uploads pass UPLOAD_TIMEOUT explicitly
+CLIENT_TIMEOUT = httpx.Timeout(connect=2.0, read=10.0, write=30.0, pool=5.0)
+UPLOAD_TIMEOUT = 30.0
+
+# Keep enough warm connections for the concurrently gathered checks
+CLIENT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0)
+
 class FilesEndpointTester:
     def __init__(self, base_url: str = BASE_URL):
         self.base_url = base_url
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = httpx.AsyncClient(timeout=CLIENT_TIMEOUT, limits=CLIENT_LIMITS)
         self.auth_token = None
+        self._auth_task: Optional[asyncio.Task] = None
         self.test_file_id = None
         
     async def __aenter__(self):
@@ -23,7 +58,17 @@ class FilesEndpointTester:
         await self.client.aclose()
     
     async def setup_auth(self):
-        """Setup authentication for file tests"""
+        """Setup authentication for file tests
+
+        Runs register+login once; concurrent and later callers await the same
+        task and get its result, success or failure.
+        """
+        if self._auth_task is None:
+            self._auth_task = asyncio.create_task(self._register_and_login())
+        return await self._auth_task
+    
+    async def _register_and_login(self):
+        """Register a fresh user and store its access token"""
         import time
         timestamp = int(time.time())
         
@@ -52,7 +97,7 @@ class FilesEndpointTester:
         if response.status_code != 200:
             print(f"Login failed: {response.text}")
             return False
-        auth_data = response.json()
+        auth_data = orjson.loads(response.content)
         self.auth_token = auth_data["access_token"]
         return True
     
@@ -65,7 +110,7 @@ class FilesEndpointTester:
         if response.status_code != 200:
             print(f" Demo files response body: {response.text}")
         assert response.status_code == 200
-        demo_files = response.json()
+        demo_files = orjson.loads(response.content)
         assert isinstance(demo_files, list)
         print(" Demo files endpoint passed")
     
@@ -79,27 +124,19 @@ class FilesEndpointTester:
                 print(" Skipping file upload tests - auth setup failed")
                 return
         
-        headers = {"Authorization": f"Bearer {self.auth_token}"}
+        headers = {"Authorization": f"Bearer {self.auth_token}", **JSON_HEADERS}
         
         # Test STL file upload
-        test_file_content = "This is a test STL file content for modular API testing"
-        file_data = base64.b64encode(test_file_content.encode()).decode()
-        
-        upload_request = {
-            "file_name": "test_model.stl",
-            "file_data": file_data,
-            "file_type": "stl"
-        }
-        
         response = await self.client.post(
             f"{self.base_url}/files",
-            json=upload_request,
-            headers=headers
+            content=STL_UPLOAD_BODY,
+            headers=headers,
+            timeout=UPLOAD_TIMEOUT
         )
         if response.status_code != 200:
             print(f"File upload failed with status {response.status_code}: {response.text}")
             raise AssertionError(f"Expected 200, got {response.status_code}")
-        upload_data = response.json()
+        upload_data = orjson.loads(response.content)
         assert "id" in upload_data
         assert "filename" in upload_data
         assert "file_size" in upload_data
@@ -107,23 +144,14 @@ class FilesEndpointTester:
         print(" File upload with JSON passed")
         
         # Test STP file upload
-        test_stp_content = "This is a test STP file content for modular API testing"
-        stp_data = base64.b64encode(test_stp_content.encode()).decode()
-        
-        stp_upload_request = {
-            "file_name": "test_model.stp",
-            "file_data": stp_data,
-            "file_type": "stp",
-            "description": "Test STP model for modular API testing"
-        }
-        
         response = await self.client.post(
             f"{self.base_url}/files",
-            json=stp_upload_request,
-            headers=headers
+            content=STP_UPLOAD_BODY,
+            headers=headers,
+            timeout=UPLOAD_TIMEOUT
         )
         assert response.status_code == 200
-        stp_upload_data = response.json()
+        stp_upload_data = orjson.loads(response.content)
         assert "id" in stp_upload_data
         print(" STP file upload with JSON passed")
     
@@ -145,7 +173,7 @@ class FilesEndpointTester:
             headers=headers
         )
         assert response.status_code == 200
-        files = response.json()
+        files = orjson.loads(response.content)
         assert isinstance(files, list)
         print(" File listing passed")
     
@@ -170,7 +198,7 @@ class FilesEndpointTester:
             headers=headers
         )
         assert response.status_code == 200
-        file_data = response.json()
+        file_data = orjson.loads(response.content)
         assert file_data["id"] == self.test_file_id
         assert "filename" in file_data
         assert "file_size" in file_data
@@ -192,12 +220,14 @@ class FilesEndpointTester:
         
         headers = {"Authorization": f"Bearer {self.auth_token}"}
         
-        response = await self.client.get(
+        # Only the status and headers are checked, so the body is never read
+        async with self.client.stream(
+            "GET",
             f"{self.base_url}/files/{self.test_file_id}/download",
             headers=headers
-        )
-        assert response.status_code == 200
-        assert response.headers["content-type"] == "application/octet-stream"
+        ) as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/octet-stream"
         print(" File download passed")
     
     async def test_file_preview(self):
@@ -216,12 +246,13 @@ class FilesEndpointTester:
         
         headers = {"Authorization": f"Bearer {self.auth_token}"}
         
-        response = await self.client.get(
+        async with self.client.stream(
+            "GET",
             f"{self.base_url}/files/{self.test_file_id}/preview",
             headers=headers
-        )
-        assert response.status_code == 200
-        assert response.headers["content-type"] == "image/png"
+        ) as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "image/png"
         print(" File preview passed")
     
     async def test_file_access_control(self):
@@ -269,17 +300,11 @@ class FilesEndpointTester:
         print(" Non-existent file handling passed")
         
         # Test invalid file type upload
-        invalid_upload_request = {
-            "file_name": "test.txt",
-            "file_data": base64.b64encode(b"test content").decode(),
-            "file_type": "txt",
-            "description": "Invalid file type"
-        }
-        
         response = await self.client.post(
             f"{self.base_url}/files",
-            json=invalid_upload_request,
-            headers=headers
+            content=TXT_UPLOAD_BODY,
+            headers={**headers, **JSON_HEADERS},
+            timeout=UPLOAD_TIMEOUT
         )
         assert response.status_code == 400
         print(" Invalid file type handling passed")
@@ -289,29 +314,27 @@ class FilesEndpointTester:
         print(" Starting file endpoint tests...\n")
         
         try:
-            await self.test_demo_files_endpoint()
+            # Demo files need no auth, so they run alongside the login
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self.test_demo_files_endpoint())
+                auth_task = tg.create_task(self.setup_auth())
             print()
+            if not auth_task.result():
+                print(" Skipping file upload tests - auth setup failed")
+                return
             
             await self.test_file_upload_json()
             print()
             
-            
-            await self.test_file_listing()
-            print()
-            
-            await self.test_file_details()
-            print()
-            
-            await self.test_file_download()
-            print()
-            
-            await self.test_file_preview()
-            print()
-            
-            await self.test_file_access_control()
-            print()
-            
-            await self.test_invalid_file_operations()
+            # Everything below only reads the uploaded file, so run it together;
+            # the first failure cancels the rest and surfaces as an ExceptionGroup
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self.test_file_listing())
+                tg.create_task(self.test_file_details())
+                tg.create_task(self.test_file_download())
+                tg.create_task(self.test_file_preview())
+                tg.create_task(self.test_file_access_control())
+                tg.create_task(self.test_invalid_file_operations())
             print()
             
             print(" All file tests completed successfully!")
@@ -320,7 +343,6 @@ class FilesEndpointTester:
             print(f" File test failed: {e}")
             raise
 
-
 async def main():
     """Main test runner"""
     async with FilesEndpointTester() as tester:
@@ -4,14 +4,31 @@ Provides shared utilities, mock builders, service health checkers, and assertion
 """
 import asyncio
 import httpx
-import base64
+import itertools
 import time
 import json
 import os
+import random
 from typing import Dict, Any, Optional, List, Callable
-from pathlib import Path
+from types import MappingProxyType
 import uuid
 
+import orjson
+
+try:
+    from pybase64 import b64encode as _b64encode
+except ImportError:  # SIMD codec is optional; binascii is what base64.b64encode wraps
+    from binascii import b2a_base64
+
+    def _b64encode(data: bytes | bytearray | memoryview) -> bytes:
+        return b2a_base64(data, newline=False)
+
+try:
+    import uvloop
+except ImportError:  # uvloop has no Windows support; fall back to stdlib asyncio
+    uvloop = None
+
+from tests import test_config
 from tests.test_config import (
     BASE_URL,
     CALCULATOR_URL,
@@ -19,7 +36,6 @@ from tests.test_config import (
     QUICK_TIMEOUT,
     MAX_RETRIES,
     RETRY_DELAY_SECONDS,
-    MOCK_CALCULATOR_RESPONSE,
 )
 
 
@@ -27,37 +43,71 @@ from tests.test_config import (
 # Service Health Checkers
 # ============================================================================
 
-async def is_calculator_available() -> bool:
-    """Check if calculator service is available on port 7000"""
+# Shared client for health checks, tied to the loop it was created on
+_health_client: Optional[httpx.AsyncClient] = None
+_health_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_health_client() -> httpx.AsyncClient:
+    """Return the shared health-check client, recreating it on a new event loop
+
+    Pooled connections cannot outlive their loop, so a client made under a
+    previous asyncio.run() is dropped rather than reused. There is no await
+    between the check and the assignment, so no lock is needed.
+    """
+    global _health_client, _health_client_loop
+    loop = asyncio.get_running_loop()
+    if _health_client is None or _health_client_loop is not loop:
+        _health_client = httpx.AsyncClient(timeout=QUICK_TIMEOUT)
+        _health_client_loop = loop
+    return _health_client
+
+
+async def close_health_client() -> None:
+    """Close the shared health-check client if it belongs to the running loop"""
+    global _health_client, _health_client_loop
+    if _health_client is not None and _health_client_loop is asyncio.get_running_loop():
+        await _health_client.aclose()
+    _health_client = None
+    _health_client_loop = None
+
+
+async def _is_healthy(url: str, client: Optional[httpx.AsyncClient] = None) -> bool:
+    """GET a health URL on the given client, or on the shared one if none"""
     try:
-        async with httpx.AsyncClient(timeout=QUICK_TIMEOUT) as client:
-            response = await client.get(f"{CALCULATOR_URL}/health")
-            return response.status_code == 200
+        response = await (client or _get_health_client()).get(url, timeout=QUICK_TIMEOUT)
+        return response.status_code == 200
     except Exception:
         return False
 
 
-async def is_backend_available() -> bool:
+async def is_calculator_available(client: Optional[httpx.AsyncClient] = None) -> bool:
+    """Check if calculator service is available on port 7000"""
+    return await _is_healthy(f"{CALCULATOR_URL}/health", client)
+
+
+async def is_backend_available(client: Optional[httpx.AsyncClient] = None) -> bool:
     """Check if backend service is available"""
-    try:
-        async with httpx.AsyncClient(timeout=QUICK_TIMEOUT) as client:
-            response = await client.get(f"{BASE_URL}/health")
-            return response.status_code == 200
-    except Exception:
-        return False
+    return await _is_healthy(f"{BASE_URL}/health", client)
 
 
 async def wait_for_service(
     check_func: Callable,
     timeout: int = 30,
-    interval: int = 1
+    interval: float = 2.0
 ) -> bool:
-    """Wait for a service to become available"""
-    start_time = time.time()
-    while time.time() - start_time < timeout:
+    """Wait for a service to become available
+
+    Polls with exponential backoff from 0.1s up to ``interval`` seconds, plus a
+    little jitter so suites polling the same service don't probe in lockstep.
+    """
+    start_time = time.monotonic()
+    delay = 0.1
+    while time.monotonic() - start_time < timeout:
         if await check_func():
             return True
-        await asyncio.sleep(interval)
+        await asyncio.sleep(delay + random.random() * 0.05)
+        delay = min(delay * 1.5, interval)
     return False
 
 
@@ -65,16 +115,19 @@ async def wait_for_service(
 # Test Data Generators
 # ============================================================================
 
+# Process-wide sequence seeded from the start time (ms): stays ordered across
+# runs and never repeats within one, even for names generated in the same second
+_sequence = itertools.count(int(time.time() * 1000))
+
+
 def generate_unique_username(prefix: str = "test_user") -> str:
-    """Generate unique username with timestamp and UUID"""
-    timestamp = int(time.time())
-    short_uuid = str(uuid.uuid4())[:8]
-    return f"{prefix}_{timestamp}_{short_uuid}"
+    """Generate unique username with sequence number and UUID"""
+    return f"{prefix}_{next(_sequence)}_{uuid.uuid4().hex[:8]}"
 
 
-def generate_test_user(user_type: str = "individual") -> Dict[str, str]:
+def generate_test_user(user_type: str = "individual", prefix: str = "test_user") -> Dict[str, str]:
     """Generate test user data"""
-    username = generate_unique_username()
+    username = generate_unique_username(prefix)
     return {
         "username": username,
         "email": f"{username}@test.com",
@@ -110,6 +163,23 @@ def generate_test_order_data(
     }
 
 
+# Minimal order body shared by order validation tests; read-only so one test
+# cannot leak edits into the next
+_ORDER_DEFAULTS = MappingProxyType({
+    "service_id": "cnc-milling",
+    "quantity": 1,
+    "material_id": "alum_D16",
+    "length": 100,
+    "width": 50,
+    "height": 25,
+})
+
+
+def make_order_payload(**overrides: Any) -> Dict[str, Any]:
+    """Build a fresh minimal order body with overrides applied"""
+    return {**_ORDER_DEFAULTS, **overrides}
+
+
 def generate_test_calculation_data(service_id: str = "cnc-milling") -> Dict[str, Any]:
     """Generate test calculation data"""
     return {
@@ -130,32 +200,44 @@ def generate_test_calculation_data(service_id: str = "cnc-milling") -> Dict[str,
     }
 
 
+# Simple triangle STL file; adjacent literals are joined at compile time
+_TEST_STL_CONTENT = (
+    b"solid test\n"
+    b"  facet normal 0 0 1\n"
+    b"    outer loop\n"
+    b"      vertex 0 0 0\n"
+    b"      vertex 10 0 0\n"
+    b"      vertex 5 10 0\n"
+    b"    endloop\n"
+    b"  endfacet\n"
+    b"endsolid test\n"
+)
+
+
 def create_test_stl_content() -> bytes:
     """Create a simple valid STL file content"""
-    # Simple triangle STL file
-    stl_content = b"solid test\n"
-    stl_content += b"  facet normal 0 0 1\n"
-    stl_content += b"    outer loop\n"
-    stl_content += b"      vertex 0 0 0\n"
-    stl_content += b"      vertex 10 0 0\n"
-    stl_content += b"      vertex 5 10 0\n"
-    stl_content += b"    endloop\n"
-    stl_content += b"  endfacet\n"
-    stl_content += b"endsolid test\n"
-    return stl_content
+    return _TEST_STL_CONTENT
+
 
+def encode_file_to_base64(file_content: bytes | bytearray | memoryview) -> str:
+    """Encode file content to base64 string
 
-def encode_file_to_base64(file_content: bytes) -> str:
-    """Encode file content to base64 string"""
-    return base64.b64encode(file_content).decode('utf-8')
+    Takes any bytes-like object as is, so callers can pass a buffer or a
+    memoryview slice without copying it to bytes first.
+    """
+    return _b64encode(file_content).decode('ascii')
+
+
+# Static upload payloads, encoded once at import
+_STL_BASE64 = encode_file_to_base64(create_test_stl_content())
+_PDF_BASE64 = encode_file_to_base64(b"%PDF-1.4\nTest document content\n%%EOF")
 
 
 def generate_test_file_upload() -> Dict[str, str]:
     """Generate test file upload data"""
-    stl_content = create_test_stl_content()
     return {
-        "file_name": f"test_model_{int(time.time())}.stl",
-        "file_data": encode_file_to_base64(stl_content),
+        "file_name": f"test_model_{next(_sequence)}.stl",
+        "file_data": _STL_BASE64,
         "file_type": "stl",
         "description": "Test STL file",
     }
@@ -163,10 +245,9 @@ def generate_test_file_upload() -> Dict[str, str]:
 
 def generate_test_document_upload() -> Dict[str, str]:
     """Generate test document upload data"""
-    pdf_content = b"%PDF-1.4\nTest document content\n%%EOF"
     return {
-        "document_name": f"test_doc_{int(time.time())}.pdf",
-        "document_data": encode_file_to_base64(pdf_content),
+        "document_name": f"test_doc_{next(_sequence)}.pdf",
+        "document_data": _PDF_BASE64,
         "document_category": "technical_spec",
     }
 
@@ -181,11 +262,12 @@ def mock_calculator_response(
     **kwargs
 ) -> Dict[str, Any]:
     """Build mock calculator response"""
-    response = MOCK_CALCULATOR_RESPONSE.copy()
-    response["service_id"] = service_id
-    response["total_price"] = total_price
-    response.update(kwargs)
-    return response
+    return {
+        **test_config.MOCK_CALCULATOR_RESPONSE,
+        "service_id": service_id,
+        "total_price": total_price,
+        **kwargs,
+    }
 
 
 # ============================================================================
@@ -197,38 +279,52 @@ def assert_response_schema(
     required_fields: List[str],
     optional_fields: Optional[List[str]] = None
 ) -> None:
-    """Assert response contains required fields"""
-    for field in required_fields:
-        assert field in response, f"Required field '{field}' missing from response"
+    """Assert response contains required fields, and only known ones if optional given"""
+    missing = set(required_fields) - response.keys()
+    assert not missing, f"Required field(s) {sorted(missing)} missing from response"
     
     if optional_fields:
-        all_fields = set(required_fields + optional_fields)
-        for field in response.keys():
-            assert field in all_fields, f"Unexpected field '{field}' in response"
+        extra = response.keys() - frozenset(required_fields).union(optional_fields)
+        assert not extra, f"Unexpected field(s) {sorted(extra)} in response"
+
+
+# Top-level keys each response must carry; nested values are not re-validated
+USER_SCHEMA_FIELDS = frozenset({"id", "username", "email", "user_type", "created_at"})
+FILE_SCHEMA_FIELDS = frozenset({
+    "id", "filename", "original_filename", "file_size", "file_type", "uploaded_at"
+})
+ORDER_SCHEMA_FIELDS = frozenset({
+    "order_id", "user_id", "service_id", "status", "total_price", "created_at"
+})
+CALCULATION_SCHEMA_FIELDS = frozenset({
+    "service_id", "total_price", "detail_price", "mat_price", "work_price"
+})
+
+
+def _assert_has_fields(data: Dict[str, Any], required: frozenset, kind: str) -> None:
+    """Assert all required keys are present using a single set difference"""
+    missing = required - data.keys()
+    assert not missing, f"Required field(s) {sorted(missing)} missing from {kind} response"
 
 
 def assert_user_schema(user: Dict[str, Any]) -> None:
     """Assert user object has correct schema"""
-    required_fields = ["id", "username", "email", "user_type", "created_at"]
-    assert_response_schema(user, required_fields)
+    _assert_has_fields(user, USER_SCHEMA_FIELDS, "user")
 
 
 def assert_file_schema(file: Dict[str, Any]) -> None:
     """Assert file object has correct schema"""
-    required_fields = ["id", "filename", "original_filename", "file_size", "file_type", "uploaded_at"]
-    assert_response_schema(file, required_fields)
+    _assert_has_fields(file, FILE_SCHEMA_FIELDS, "file")
 
 
 def assert_order_schema(order: Dict[str, Any]) -> None:
     """Assert order object has correct schema"""
-    required_fields = ["order_id", "user_id", "service_id", "status", "total_price", "created_at"]
-    assert_response_schema(order, required_fields)
+    _assert_has_fields(order, ORDER_SCHEMA_FIELDS, "order")
 
 
 def assert_calculation_schema(calculation: Dict[str, Any]) -> None:
     """Assert calculation response has correct schema"""
-    required_fields = ["service_id", "total_price", "detail_price", "mat_price", "work_price"]
-    assert_response_schema(calculation, required_fields)
+    _assert_has_fields(calculation, CALCULATION_SCHEMA_FIELDS, "calculation")
 
 
 async def assert_file_exists(file_path: str) -> None:
@@ -252,24 +348,33 @@ async def cleanup_test_user(
     admin_token: str
 ) -> None:
     """Clean up test user (admin operation)"""
+    await cleanup_test_users(client, base_url, [username], admin_token)
+
+
+async def cleanup_test_users(
+    client: httpx.AsyncClient,
+    base_url: str,
+    usernames: List[str],
+    admin_token: str
+) -> None:
+    """Clean up several test users with one user listing (admin operation)
+
+    /users has no username filter, so the list is fetched once and indexed
+    by username; the deletes then run concurrently.
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
     try:
-        # Get user by username
-        response = await client.get(
-            f"{base_url}/users",
-            headers={"Authorization": f"Bearer {admin_token}"}
-        )
-        if response.status_code == 200:
-            users = response.json()
-            for user in users:
-                if user.get("username") == username:
-                    # Delete user
-                    await client.delete(
-                        f"{base_url}/users/{user['id']}",
-                        headers={"Authorization": f"Bearer {admin_token}"}
-                    )
-                    break
+        response = await client.get(f"{base_url}/users", headers=headers)
+        if response.status_code != 200:
+            return
+        by_name = {user.get("username"): user for user in response_json(response)}
+        await asyncio.gather(*(
+            client.delete(f"{base_url}/users/{by_name[username]['id']}", headers=headers)
+            for username in usernames
+            if username in by_name
+        ))
     except Exception as e:
-        print(f"Warning: Failed to cleanup user {username}: {e}")
+        print(f"Warning: Failed to cleanup users {usernames}: {e}")
 
 
 async def cleanup_test_file(
@@ -304,14 +409,41 @@ async def cleanup_test_order(
         print(f"Warning: Failed to cleanup order {order_id}: {e}")
 
 
+async def cleanup_test_files(
+    client: httpx.AsyncClient,
+    base_url: str,
+    file_ids: List[int],
+    auth_token: str
+) -> None:
+    """Clean up several test files concurrently"""
+    await asyncio.gather(
+        *(cleanup_test_file(client, base_url, file_id, auth_token) for file_id in file_ids)
+    )
+
+
+async def cleanup_test_orders(
+    client: httpx.AsyncClient,
+    base_url: str,
+    order_ids: List[int],
+    admin_token: str
+) -> None:
+    """Clean up several test orders concurrently (admin operation)"""
+    await asyncio.gather(
+        *(cleanup_test_order(client, base_url, order_id, admin_token) for order_id in order_ids)
+    )
+
+
 async def cleanup_uploads_directory() -> None:
     """Clean up test uploads directory"""
     try:
-        test_uploads = Path("uploads/test")
-        if test_uploads.exists():
-            for file in test_uploads.glob("*"):
-                if file.is_file():
-                    file.unlink()
+        # DirEntry caches its type from the directory read, so no extra stat;
+        # symlinks are not followed, so a link to a real file is left alone
+        with os.scandir("uploads/test") as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    os.unlink(entry.path)
+    except FileNotFoundError:
+        pass
     except Exception as e:
         print(f"Warning: Failed to cleanup uploads: {e}")
 
@@ -339,6 +471,45 @@ async def retry_async(
     raise last_exception
 
 
+# ============================================================================
+# Event Loop Helpers
+# ============================================================================
+
+EVENT_LOOP_FACTORY: Callable[[], asyncio.AbstractEventLoop] = (
+    uvloop.new_event_loop if uvloop is not None else asyncio.new_event_loop
+)
+
+
+def new_event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Return the uvloop policy when available, else the default asyncio one"""
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+# ============================================================================
+# HTTP Helpers
+# ============================================================================
+
+async def post_json(
+    client: httpx.AsyncClient,
+    url: str,
+    data: Any,
+    headers: Optional[Dict[str, str]] = None
+) -> httpx.Response:
+    """POST a JSON body serialized with orjson instead of stdlib json"""
+    return await client.post(
+        url,
+        content=orjson.dumps(data),
+        headers={"Content-Type": "application/json", **(headers or {})}
+    )
+
+
+def response_json(response: httpx.Response) -> Any:
+    """Parse a JSON response body with orjson"""
+    return orjson.loads(response.content)
+
+
 # ============================================================================
 # Authentication Helpers
 # ============================================================================
@@ -361,10 +532,11 @@ async def login_user(
 async def register_and_login(
     client: httpx.AsyncClient,
     base_url: str,
-    user_type: str = "individual"
+    user_type: str = "individual",
+    prefix: str = "test_user"
 ) -> tuple[Dict[str, str], str]:
     """Register a new user and login, return user data and token"""
-    user_data = generate_test_user(user_type)
+    user_data = generate_test_user(user_type, prefix)
     
     # Register
     response = await client.post(f"{base_url}/register", json=user_data)
@@ -380,19 +552,30 @@ async def register_and_login(
 # Response Validators
 # ============================================================================
 
+def assert_status(response: httpx.Response, expected_status: int) -> None:
+    """Assert the status code only; the body is read just to report a failure"""
+    assert response.status_code == expected_status, \
+        f"Expected status {expected_status}, got {response.status_code}: {response.text}"
+
+
+def assert_error_body(response: httpx.Response, expected_status: int) -> None:
+    """Assert the status code and that the JSON body carries an error message"""
+    assert_status(response, expected_status)
+    error_data = response_json(response)
+    assert "error" in error_data or "detail" in error_data or "message" in error_data, \
+        f"No error message in response: {response.text}"
+
+
 def validate_error_response(
     response: httpx.Response,
     expected_status: int,
     expected_error: Optional[str] = None
 ) -> None:
     """Validate error response structure"""
-    assert response.status_code == expected_status, \
-        f"Expected status {expected_status}, got {response.status_code}: {response.text}"
-    
     if expected_error:
-        error_data = response.json()
-        assert "error" in error_data or "detail" in error_data or "message" in error_data, \
-            f"No error message in response: {response.text}"
+        assert_error_body(response, expected_status)
+    else:
+        assert_status(response, expected_status)
 
 
 def validate_success_response(
@@ -402,5 +585,5 @@ def validate_success_response(
     """Validate success response and return JSON"""
     assert response.status_code == expected_status, \
         f"Expected status {expected_status}, got {response.status_code}: {response.text}"
-    return response.json()
+    return response_json(response)
 
@@ -14,6 +14,11 @@ from backend.database import AsyncSessionLocal
 
 BASE_URL = "http://localhost:8000"
 
+# Admin credentials, read from the environment once at import
+ADMIN_USERNAME = os.getenv("ADMIN_USERNAME", "admin")
+ADMIN_DEFAULT_PASSWORD = os.getenv("ADMIN_DEFAULT_PASSWORD", "admin")
+ADMIN_NEW_PASSWORD = os.getenv("ADMIN_NEW_PASSWORD", "admin")
+
 
 class KitsEndpointTester:
     def __init__(self, base_url: str = BASE_URL):
@@ -728,14 +733,13 @@ class KitsEndpointTester:
             await self.setup_auth()
 
         # Try to login as admin
-        import os
-        admin_user = os.getenv("ADMIN_USERNAME", "admin")
-        admin_pass = os.getenv("ADMIN_DEFAULT_PASSWORD", "admin")
+        admin_user = ADMIN_USERNAME
+        admin_pass = ADMIN_DEFAULT_PASSWORD
 
         try:
             admin_token, _admin_id = await self._login_and_get_profile(admin_user, admin_pass)
         except Exception:
-            admin_pass = os.getenv("ADMIN_NEW_PASSWORD", "admin")
+            admin_pass = ADMIN_NEW_PASSWORD
             try:
                 admin_token, _admin_id = await self._login_and_get_profile(admin_user, admin_pass)
             except Exception:
@@ -764,14 +768,13 @@ class KitsEndpointTester:
             await self.setup_auth()
 
         # Try to login as admin
-        import os
-        admin_user = os.getenv("ADMIN_USERNAME", "admin")
-        admin_pass = os.getenv("ADMIN_DEFAULT_PASSWORD", "admin")
+        admin_user = ADMIN_USERNAME
+        admin_pass = ADMIN_DEFAULT_PASSWORD
 
         try:
             admin_token, _admin_id = await self._login_and_get_profile(admin_user, admin_pass)
         except Exception:
-            admin_pass = os.getenv("ADMIN_NEW_PASSWORD", "admin")
+            admin_pass = ADMIN_NEW_PASSWORD
             try:
                 admin_token, _admin_id = await self._login_and_get_profile(admin_user, admin_pass)
             except Exception:
@@ -920,14 +923,14 @@ class KitsEndpointTester:
             await self.setup_auth()
 
         # admin login (same approach as your existing admin tests)
-        admin_user = os.getenv("ADMIN_USERNAME", "admin")
-        admin_pass = os.getenv("ADMIN_DEFAULT_PASSWORD", "admin")
+        admin_user = ADMIN_USERNAME
+        admin_pass = ADMIN_DEFAULT_PASSWORD
 
         admin_token = None
         try:
             admin_token, _admin_id = await self._login_and_get_profile(admin_user, admin_pass)
         except Exception:
-            admin_pass = os.getenv("ADMIN_NEW_PASSWORD", "admin")
+            admin_pass = ADMIN_NEW_PASSWORD
             try:
                 admin_token, _admin_id = await self._login_and_get_profile(admin_user, admin_pass)
             except Exception:
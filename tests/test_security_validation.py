@@ -85,11 +85,11 @@ class TestAuthenticationSecurity:
                 f"Malformed header '{header_value}' should be rejected"
     
     @pytest.mark.asyncio
-    async def test_expired_token_handling(self, http_client, user_account):
+    async def test_expired_token_handling(self, http_client, user_token):
         """Test expired token handling"""
         # Note: This is a placeholder - actual implementation would require
         # generating an expired token or waiting for token expiration
-        user_data, token = user_account
+        token = user_token
         
         # Simulate expired token by modifying payload
         # In real implementation, would use JWT library to create expired token
@@ -175,10 +175,10 @@ class TestAuthorizationSecurity:
     
     @pytest.mark.asyncio
     async def test_regular_user_cannot_access_admin_endpoints(
-        self, http_client, user_account
+        self, http_client, user_token
     ):
         """Test that regular users cannot access admin endpoints"""
-        user_data, token = user_account
+        token = user_token
         
         admin_endpoints = [
             ("/users", "GET"),
@@ -206,10 +206,10 @@ class TestAuthorizationSecurity:
     
     @pytest.mark.asyncio
     async def test_privilege_escalation_attempt(
-        self, http_client, user_account, admin_token
+        self, http_client, fresh_user_account, admin_token
     ):
         """Test that users cannot escalate their own privileges"""
-        user_data, user_token = user_account
+        user_data, user_token = fresh_user_account
         
         # Get user profile
         response = await http_client.get(
@@ -272,9 +272,9 @@ class TestInputValidationSecurity:
                 f"SQL injection in login should be rejected: {pattern[:50]}"
     
     @pytest.mark.asyncio
-    async def test_xss_in_text_fields(self, http_client, user_account):
+    async def test_xss_in_text_fields(self, http_client, user_token):
         """Test XSS patterns in text fields"""
-        user_data, token = user_account
+        token = user_token
         
         for pattern in XSS_PATTERNS:
             # Test in file description
@@ -300,9 +300,9 @@ class TestInputValidationSecurity:
                 )
     
     @pytest.mark.asyncio
-    async def test_path_traversal_in_filename(self, http_client, user_account):
+    async def test_path_traversal_in_filename(self, http_client, user_token):
         """Test path traversal patterns in file names"""
-        user_data, token = user_account
+        token = user_token
         
         for pattern in PATH_TRAVERSAL_PATTERNS:
             response = await http_client.post(
@@ -413,10 +413,10 @@ class TestSessionSecurity:
     
     @pytest.mark.asyncio
     async def test_token_cannot_be_reused_after_logout(
-        self, http_client, user_account
+        self, http_client, fresh_user_account
     ):
         """Test that tokens cannot be used after logout"""
-        user_data, token = user_account
+        user_data, token = fresh_user_account
         
         # Verify token works
         response = await http_client.get(
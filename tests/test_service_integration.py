@@ -14,45 +14,47 @@ from tests.test_helpers import is_calculator_available
 class TestCalculatorServiceIntegration:
     """Test calculator service integration"""
     
-    async def test_calculator_service_health(self, skip_if_calculator_unavailable):
+    async def test_calculator_service_health(
+        self, calculator_client, skip_if_calculator_unavailable
+    ):
         """Test calculator service health check"""
-        available = await is_calculator_available()
+        available = await is_calculator_available(calculator_client)
         assert available, "Calculator service should be available"
     
     async def test_calculator_services_endpoint(
-        self, http_client, skip_if_calculator_unavailable
+        self, http_client_real, skip_if_calculator_unavailable
     ):
         """Test fetching services from calculator"""
-        response = await http_client.get(f"{BASE_URL}/services")
+        response = await http_client_real.get(f"{BASE_URL}/services")
         assert response.status_code == 200
         services = response.json()
         assert isinstance(services, list)
         assert len(services) > 0
     
     async def test_calculator_materials_endpoint(
-        self, http_client, skip_if_calculator_unavailable
+        self, http_client_real, skip_if_calculator_unavailable
     ):
         """Test fetching materials from calculator"""
-        response = await http_client.get(f"{BASE_URL}/materials")
+        response = await http_client_real.get(f"{BASE_URL}/materials")
         assert response.status_code == 200
         materials = response.json()
         assert isinstance(materials, dict)
         assert len(materials) > 0
     
     async def test_calculator_coefficients_endpoint(
-        self, http_client, skip_if_calculator_unavailable
+        self, http_client_real, skip_if_calculator_unavailable
     ):
         """Test fetching coefficients from calculator"""
-        response = await http_client.get(f"{BASE_URL}/coefficients")
+        response = await http_client_real.get(f"{BASE_URL}/coefficients")
         assert response.status_code == 200
         coefficients = response.json()
         assert isinstance(coefficients, dict)
     
     async def test_calculator_locations_endpoint(
-        self, http_client, skip_if_calculator_unavailable
+        self, http_client_real, skip_if_calculator_unavailable
     ):
         """Test fetching locations from calculator"""
-        response = await http_client.get(f"{BASE_URL}/locations")
+        response = await http_client_real.get(f"{BASE_URL}/locations")
         assert response.status_code == 200
         locations = response.json()
         assert isinstance(locations, dict)
@@ -64,10 +66,10 @@ class TestCrossServiceWorkflow:
     """Test workflows involving multiple services"""
     
     async def test_calculator_to_order_workflow(
-        self, http_client, user_account, uploaded_file
+        self, http_client_real, real_user_token, real_uploaded_file
     ):
         """Test workflow from calculation to order creation"""
-        user_data, token = user_account
+        token = real_user_token
         
         # Calculate price
         calc_data = {
@@ -80,7 +82,7 @@ class TestCrossServiceWorkflow:
             "height": 25,
         }
         
-        response = await http_client.post(
+        response = await http_client_real.post(
             f"{BASE_URL}/calculate-price",
             json=calc_data,
             headers={"Authorization": f"Bearer {token}"}
@@ -93,7 +95,7 @@ class TestCrossServiceWorkflow:
             # Create order with calculated price
             order_data = {
                 "service_id": "cnc-milling",
-                "file_id": uploaded_file,
+                "file_id": real_uploaded_file,
                 "quantity": 1,
                 "material_id": "alum_D16",
                 "material_form": "rod",
@@ -102,7 +104,7 @@ class TestCrossServiceWorkflow:
                 "height": 25,
             }
             
-            response = await http_client.post(
+            response = await http_client_real.post(
                 f"{BASE_URL}/orders",
                 json=order_data,
                 headers={"Authorization": f"Bearer {token}"}
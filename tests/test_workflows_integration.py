@@ -20,7 +20,7 @@ class TestCompleteUserJourneyIntegration:
     """Test complete user journey with real services"""
     
     async def test_end_to_end_order_creation_with_real_calculator(
-        self, http_client, skip_if_calculator_unavailable
+        self, http_client_real, skip_if_calculator_unavailable
     ):
         """
         Complete E2E workflow with real calculator service:
@@ -28,14 +28,14 @@ class TestCompleteUserJourneyIntegration:
         """
         # Step 1: Register user
         user_data = generate_test_user()
-        response = await http_client.post(
+        response = await http_client_real.post(
             f"{BASE_URL}/register",
             json=user_data
         )
         assert response.status_code == 200, "User registration failed"
         
         # Step 2: Login
-        response = await http_client.post(
+        response = await http_client_real.post(
             f"{BASE_URL}/login",
             json={
                 "username": user_data["username"],
@@ -47,7 +47,7 @@ class TestCompleteUserJourneyIntegration:
         
         # Step 3: Upload STL file
         file_upload = generate_test_file_upload()
-        response = await http_client.post(
+        response = await http_client_real.post(
             f"{BASE_URL}/files",
             json=file_upload,
             headers={"Authorization": f"Bearer {token}"}
@@ -73,7 +73,7 @@ class TestCompleteUserJourneyIntegration:
             "k_complexity": 1.0,
         }
         
-        response = await http_client.post(
+        response = await http_client_real.post(
             f"{BASE_URL}/calculate-price",
             json=calc_data,
             headers={"Authorization": f"Bearer {token}"}
@@ -85,7 +85,7 @@ class TestCompleteUserJourneyIntegration:
         
         # Step 5: Create order
         order_data = generate_test_order_data("cnc-milling", file_id)
-        response = await http_client.post(
+        response = await http_client_real.post(
             f"{BASE_URL}/orders",
             json=order_data,
             headers={"Authorization": f"Bearer {token}"}
@@ -96,7 +96,7 @@ class TestCompleteUserJourneyIntegration:
         assert order["total_price"] > 0
         
         # Step 6: Verify order was created
-        response = await http_client.get(
+        response = await http_client_real.get(
             f"{BASE_URL}/orders/{order_id}",
             headers={"Authorization": f"Bearer {token}"}
         )
@@ -106,18 +106,18 @@ class TestCompleteUserJourneyIntegration:
         assert order_details["status"] in ["pending", "new"]
         
         # Cleanup
-        await http_client.delete(
+        await http_client_real.delete(
             f"{BASE_URL}/files/{file_id}",
             headers={"Authorization": f"Bearer {token}"}
         )
     
     async def test_multiple_calculations_with_real_service(
-        self, http_client, user_account, skip_if_calculator_unavailable
+        self, http_client_real, real_user_token, skip_if_calculator_unavailable
     ):
         """
         Test multiple calculations with real calculator service
         """
-        user_data, token = user_account
+        token = real_user_token
         
         services = ["cnc-milling", "cnc-lathe", "printing"]
         
@@ -139,7 +139,7 @@ class TestCompleteUserJourneyIntegration:
                 "k_complexity": 1.0,
             }
             
-            response = await http_client.post(
+            response = await http_client_real.post(
                 f"{BASE_URL}/calculate-price",
                 json=calc_data,
                 headers={"Authorization": f"Bearer {token}"}
@@ -160,52 +160,50 @@ class TestAdminWorkflowIntegration:
     """Test admin workflows with real services"""
     
     async def test_complete_admin_oversight_workflow(
-        self, http_client, admin_token, user_account, uploaded_file
+        self, http_client_real, real_admin_token, real_user_token, real_uploaded_file
     ):
         """
         Complete admin workflow: Monitor orders → Update status → Sync
         """
-        user_data, user_token = user_account
-        
         # User creates order
-        order_data = generate_test_order_data("cnc-milling", uploaded_file)
-        response = await http_client.post(
+        order_data = generate_test_order_data("cnc-milling", real_uploaded_file)
+        response = await http_client_real.post(
             f"{BASE_URL}/orders",
             json=order_data,
-            headers={"Authorization": f"Bearer {user_token}"}
+            headers={"Authorization": f"Bearer {real_user_token}"}
         )
         assert response.status_code == 200
         order_id = response.json()["order_id"]
         
         # Admin views all orders
-        response = await http_client.get(
+        response = await http_client_real.get(
             f"{BASE_URL}/admin/orders",
-            headers={"Authorization": f"Bearer {admin_token}"}
+            headers={"Authorization": f"Bearer {real_admin_token}"}
         )
         assert response.status_code == 200
         all_orders = response.json()
         assert any(o["order_id"] == order_id for o in all_orders)
         
         # Admin updates order status
-        response = await http_client.put(
+        response = await http_client_real.put(
             f"{BASE_URL}/admin/orders/{order_id}",
             json={"status": "processing"},
-            headers={"Authorization": f"Bearer {admin_token}"}
+            headers={"Authorization": f"Bearer {real_admin_token}"}
         )
         assert response.status_code == 200
         
         # Verify status updated
-        response = await http_client.get(
+        response = await http_client_real.get(
             f"{BASE_URL}/orders/{order_id}",
-            headers={"Authorization": f"Bearer {user_token}"}
+            headers={"Authorization": f"Bearer {real_user_token}"}
         )
         assert response.status_code == 200
         assert response.json()["status"] == "processing"
         
         # Check sync queue
-        response = await http_client.get(
+        response = await http_client_real.get(
             f"{BASE_URL}/sync/queue",
-            headers={"Authorization": f"Bearer {admin_token}"}
+            headers={"Authorization": f"Bearer {real_admin_token}"}
         )
         assert response.status_code == 200
 
@@ -216,12 +214,12 @@ class TestServiceAvailabilityHandling:
     """Test handling of service availability"""
     
     async def test_graceful_degradation_calculator_unavailable(
-        self, http_client, user_account
+        self, http_client_real, real_user_token
     ):
         """
         Test graceful handling when calculator service is unavailable
         """
-        user_data, token = user_account
+        token = real_user_token
         
         # Try calculation (may fail if service down)
         calc_data = {
@@ -234,7 +232,7 @@ class TestServiceAvailabilityHandling:
             "height": 25,
         }
         
-        response = await http_client.post(
+        response = await http_client_real.post(
             f"{BASE_URL}/calculate-price",
             json=calc_data,
             headers={"Authorization": f"Bearer {token}"}
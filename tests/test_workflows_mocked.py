@@ -135,12 +135,12 @@ class TestCompleteUserJourneyMocked:
         )
     
     async def test_file_upload_preview_download_workflow(
-        self, http_client, user_account
+        self, http_client, user_token
     ):
         """
         Workflow: Upload File → Check Preview → Download File → Delete
         """
-        user_data, token = user_account
+        token = user_token
         
         # Upload file
         file_upload = generate_test_file_upload()
@@ -209,8 +209,6 @@ class TestAdminWorkflowMocked:
             headers={"Authorization": f"Bearer {admin_token}"}
         )
         assert response.status_code == 200
-        users_before = response.json()
-        initial_count = len(users_before)
         
         # Create test user
         user_data = generate_test_user()
@@ -222,14 +220,15 @@ class TestAdminWorkflowMocked:
         new_user = response.json()
         user_id = new_user["id"]
         
-        # Verify user count increased
+        # Verify the new user is listed; a count check would race with users
+        # registered by other xdist workers between the two GETs
         response = await http_client.get(
             f"{BASE_URL}/users",
             headers={"Authorization": f"Bearer {admin_token}"}
         )
         assert response.status_code == 200
         users_after = response.json()
-        assert len(users_after) == initial_count + 1
+        assert any(u["id"] == user_id for u in users_after)
         
         # Get specific user
         response = await http_client.get(
@@ -249,13 +248,11 @@ class TestAdminWorkflowMocked:
         assert response.status_code == 200
     
     async def test_admin_order_management_workflow(
-        self, http_client, admin_token, user_account, uploaded_file
+        self, http_client, admin_token, user_token, uploaded_file
     ):
         """
         Admin workflow: View All Orders → View Order → Update Order Status
         """
-        user_data, user_token = user_account
-        
         # User creates an order
         order_data = generate_test_order_data("cnc-milling", uploaded_file)
         response = await http_client.post(
@@ -303,13 +300,11 @@ class TestAdminWorkflowMocked:
         assert updated_order["status"] == "processing"
     
     async def test_admin_call_request_workflow(
-        self, http_client, admin_token, user_account
+        self, http_client, admin_token, user_token
     ):
         """
         Admin workflow: View Call Requests → Update Status
         """
-        user_data, user_token = user_account
-        
         # User creates call request
         call_request_data = {
             "name": "Test User",
@@ -353,12 +348,12 @@ class TestErrorRecoveryWorkflowMocked:
     """Test error recovery workflows with mocked services"""
     
     async def test_failed_upload_retry_success(
-        self, http_client, user_account
+        self, http_client, user_token
     ):
         """
         Workflow: Failed Upload → Retry → Success
         """
-        user_data, token = user_account
+        token = user_token
         
         # First attempt with invalid data
         response = await http_client.post(
@@ -389,12 +384,12 @@ class TestErrorRecoveryWorkflowMocked:
         )
     
     async def test_failed_order_creation_retry(
-        self, http_client, user_account, uploaded_file
+        self, http_client, user_token, uploaded_file
     ):
         """
         Workflow: Failed Order Creation → Fix Data → Retry → Success
         """
-        user_data, token = user_account
+        token = user_token
         
         # First attempt with invalid data
         invalid_order = {
@@ -461,12 +456,12 @@ class TestMultiServiceWorkflowMocked:
     """Test workflows across multiple services"""
     
     async def test_multiple_file_types_workflow(
-        self, http_client, user_account
+        self, http_client, user_token
     ):
         """
         Workflow: Upload STL → Upload Document → Upload STP → List All
         """
-        user_data, token = user_account
+        token = user_token
         
         uploaded_ids = []
         
@@ -523,12 +518,12 @@ class TestMultiServiceWorkflowMocked:
                 )
     
     async def test_multiple_orders_workflow(
-        self, http_client, user_account, uploaded_file
+        self, http_client, user_token, uploaded_file
     ):
         """
         Workflow: Create Multiple Orders → List → Check Each
         """
-        user_data, token = user_account
+        token = user_token
         
         # Create orders for different services
         services = ["cnc-milling", "cnc-lathe", "printing"]